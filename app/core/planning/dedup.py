@@ -0,0 +1,345 @@
+# app/core/planning/dedup.py
+
+from __future__ import annotations
+
+import re
+import zlib
+from collections import defaultdict
+from typing import Dict, List, Sequence, Set
+
+import numpy as np
+
+from app.core.planning.models import Epic, Plan, Priority, Status, Story, Task
+
+# -------------------------------------------------------------------
+# Near-duplicate detection for epics and stories
+#
+# LLM outlines tend to repeat the same story with slightly different
+# wording. Each text is reduced to its content words (user-story
+# boilerplate and stopwords removed), shingled into word unigrams and
+# bigrams, summarised with a MinHash signature and bucketed with LSH
+# banding, so only texts that share a band are ever compared. Candidates
+# are confirmed with the exact Jaccard similarity of their shingle sets.
+#
+# Texts with identical shingle sets are merged up front by hashing, and
+# LSH buckets larger than _MAX_BUCKET (templated stories such as "manage
+# settings for team N" share most of their MinHash values) are split on
+# more rows of the signature, so the work per bucket stays bounded and
+# the whole pass stays close to linear in the number of texts.
+#
+# Word shingles keep one changed word significant: "Implement user
+# login" vs "Implement user logout" scores 0.4, not 0.75 as with
+# character shingles, so stories that differ in a verb or format are
+# never merged.
+# -------------------------------------------------------------------
+
+DEFAULT_THRESHOLD = 0.85
+
+_NUM_PERM = 64
+_BANDS = 16  # 16 bands x 4 rows, catches pairs from ~0.5 similarity upwards
+_ROWS_PER_BAND = _NUM_PERM // _BANDS
+_MERSENNE_PRIME = (1 << 31) - 1
+_HASH_MASK = (1 << 31) - 1
+_ESTIMATE_SLACK = 0.15  # MinHash estimate error margin before exact check
+_CHUNK_SHINGLES = 200_000  # bounds the (perm x shingle) working matrix
+_MAX_BUCKET = 64  # larger LSH buckets are split on more signature rows
+
+_rng = np.random.default_rng(20240611)
+_PERM_A = _rng.integers(1, _MERSENNE_PRIME, size=_NUM_PERM, dtype=np.uint64)
+_PERM_B = _rng.integers(0, _MERSENNE_PRIME, size=_NUM_PERM, dtype=np.uint64)
+
+_PRIORITY_RANK = {Priority.HIGH: 0, Priority.MEDIUM: 1, Priority.LOW: 2}
+_STATUS_RANK = {Status.PLANNED: 0, Status.IN_PROGRESS: 1, Status.DONE: 2}
+
+# "As a user, I want to ...", "As an admin I'd like ...", "so that ..." stays
+_STORY_BOILERPLATE = re.compile(
+    r"\bas an? [a-z0-9 ]{1,40}?,? i (?:want|would like|need|d like)(?: to| an| a)?\b"
+)
+_STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "can", "for", "from",
+    "i", "in", "into", "is", "it", "its", "me", "my", "of", "on", "or", "our",
+    "so", "that", "the", "their", "this", "to", "us", "we", "with", "able",
+}
+
+
+def _normalize_text(text: str) -> str:
+    """Lowercase, join hyphenated words and collapse punctuation to spaces."""
+    text = re.sub(r"(?<=\w)-(?=\w)", "", text.lower())
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", text).split())
+
+
+def _content_words(text: str) -> List[str]:
+    """Words that carry meaning: boilerplate and stopwords removed, plurals folded."""
+    normalized = _STORY_BOILERPLATE.sub(" ", _normalize_text(text))
+    words = []
+    for word in normalized.split():
+        if word in _STOPWORDS:
+            continue
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        words.append(word)
+    return words
+
+
+def _shingles(text: str) -> Set[int]:
+    """Hash the word unigrams and bigrams of a text into 31-bit ints."""
+    words = _content_words(text)
+    grams = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+    return {zlib.crc32(g.encode("utf-8")) & _HASH_MASK for g in grams}
+
+
+def _minhash_signatures(shingle_sets: Sequence[Set[int]]) -> np.ndarray:
+    """
+    Compute MinHash signatures for non-empty shingle sets.
+
+    Returns an array of shape (len(shingle_sets), _NUM_PERM). All sets are
+    flattened into one array and reduced per document with
+    np.minimum.reduceat, in chunks so memory stays bounded.
+    """
+    signatures = np.empty((len(shingle_sets), _NUM_PERM), dtype=np.uint64)
+
+    start = 0
+    while start < len(shingle_sets):
+        end = start
+        total = 0
+        while end < len(shingle_sets) and (total == 0 or total + len(shingle_sets[end]) <= _CHUNK_SHINGLES):
+            total += len(shingle_sets[end])
+            end += 1
+
+        chunk = shingle_sets[start:end]
+        hashes = np.fromiter(
+            (h for s in chunk for h in s), dtype=np.uint64, count=total
+        )
+        offsets = np.cumsum([0] + [len(s) for s in chunk[:-1]])
+        permuted = (_PERM_A[:, None] * hashes[None, :] + _PERM_B[:, None]) % _MERSENNE_PRIME
+        signatures[start:end] = np.minimum.reduceat(permuted, offsets, axis=1).T
+        start = end
+
+    return signatures
+
+
+def _band_buckets(signatures: np.ndarray, band: int) -> List[List[int]]:
+    """
+    Candidate buckets (positions with more than one member) for one band.
+
+    A bucket over _MAX_BUCKET members is re-keyed on twice as many rows,
+    taking the following signature columns, until it is small enough or
+    the whole signature is used.
+    """
+    start = band * _ROWS_PER_BAND
+    pending = [(list(range(len(signatures))), _ROWS_PER_BAND)]
+    result: List[List[int]] = []
+    while pending:
+        members, rows = pending.pop()
+        columns = (start + np.arange(rows)) % _NUM_PERM
+        keys = signatures[np.ix_(members, columns)]
+        buckets: Dict[bytes, List[int]] = defaultdict(list)
+        for pos, key in zip(members, keys):
+            buckets[key.tobytes()].append(pos)
+        for bucket in buckets.values():
+            if len(bucket) < 2:
+                continue
+            if len(bucket) > _MAX_BUCKET and rows < _NUM_PERM:
+                pending.append((bucket, min(rows * 2, _NUM_PERM)))
+            else:
+                result.append(bucket)
+    return result
+
+
+def _jaccard(a: Set[int], b: Set[int]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def find_near_duplicates(
+    texts: Sequence[str],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[List[int]]:
+    """
+    Group indexes of texts that are near-duplicates of each other.
+
+    Only groups with more than one member are returned. Each group is
+    sorted, so its first index is the earliest occurrence.
+    """
+    shingle_sets = [_shingles(t) for t in texts]
+
+    parent = list(range(len(texts)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(i: int, j: int) -> None:
+        ri, rj = find(i), find(j)
+        if ri != rj:
+            parent[max(ri, rj)] = min(ri, rj)
+
+    # Identical shingle sets (same text after normalization) merge without
+    # LSH; only the first of each goes on to the MinHash pass.
+    first_of: Dict[frozenset, int] = {}
+    indexed: List[int] = []
+    for i, shingles in enumerate(shingle_sets):
+        if not shingles:
+            continue
+        key = frozenset(shingles)
+        if key in first_of:
+            union(first_of[key], i)
+        else:
+            first_of[key] = i
+            indexed.append(i)
+
+    if len(indexed) >= 2:
+        signatures = _minhash_signatures([shingle_sets[i] for i in indexed])
+        for band in range(_BANDS):
+            for members in _band_buckets(signatures, band):
+                # Compare each member against one representative per cluster
+                # already seen in this bucket, so an unrelated first member
+                # cannot hide duplicates among the others. Buckets are at most
+                # _MAX_BUCKET long (a fully split one holds identical
+                # signatures), and only the latest _MAX_BUCKET representatives
+                # are kept, so this stays bounded. The MinHash estimate screens
+                # out weak candidates in one vector op before the exact check.
+                reps: List[int] = []
+                for pos in members:
+                    i = indexed[pos]
+                    if reps:
+                        estimates = (signatures[reps] == signatures[pos]).mean(axis=1)
+                        for rep, estimate in zip(reps, estimates):
+                            if estimate < threshold - _ESTIMATE_SLACK:
+                                continue
+                            j = indexed[rep]
+                            if find(i) == find(j):
+                                continue
+                            if _jaccard(shingle_sets[i], shingle_sets[j]) >= threshold:
+                                union(i, j)
+                    if all(find(indexed[rep]) != find(i) for rep in reps):
+                        reps.append(pos)
+                        del reps[:-_MAX_BUCKET]
+
+    groups: Dict[int, List[int]] = defaultdict(list)
+    for i, shingles in enumerate(shingle_sets):
+        if not shingles:
+            continue
+        groups[find(i)].append(i)
+    return [sorted(g) for g in groups.values() if len(g) > 1]
+
+
+# -------------------------------------------------------------------
+# Merging
+# -------------------------------------------------------------------
+
+
+def _higher_priority(a: Priority, b: Priority) -> Priority:
+    return a if _PRIORITY_RANK.get(a, 1) <= _PRIORITY_RANK.get(b, 1) else b
+
+
+def _task_role(task: Task) -> tuple:
+    """Labels ("setup", "implementation", "testing") or, without labels, the title."""
+    return ("labels", tuple(sorted(task.labels))) if task.labels else ("title", task.title)
+
+
+def _merge_story_into(keep: Story, duplicate: Story) -> None:
+    """Fold a duplicate story's details and tasks into the story we keep."""
+    if not keep.description and duplicate.description:
+        keep.description = duplicate.description
+
+    for criterion in duplicate.acceptance_criteria:
+        if criterion not in keep.acceptance_criteria:
+            keep.acceptance_criteria.append(criterion)
+
+    keep.priority = _higher_priority(keep.priority, duplicate.priority)
+
+    # Generated task titles embed the story title ("Setup for: <story>"), so
+    # tasks are matched on their role label; the kept task takes over the
+    # more advanced status of the one it replaces.
+    existing = {_task_role(t): t for t in keep.tasks}
+    for task in duplicate.tasks:
+        match = existing.get(_task_role(task))
+        if match is None:
+            task.story_id = keep.id
+            keep.tasks.append(task)
+            existing[_task_role(task)] = task
+        elif _STATUS_RANK.get(task.status, 0) > _STATUS_RANK.get(match.status, 0):
+            match.status = task.status
+
+
+def _merge_epic_into(keep: Epic, duplicate: Epic) -> None:
+    """Move a duplicate epic's stories under the epic we keep."""
+    if not keep.description and duplicate.description:
+        keep.description = duplicate.description
+
+    keep.priority = _higher_priority(keep.priority, duplicate.priority)
+
+    for story in duplicate.stories:
+        story.epic_id = keep.id
+        keep.stories.append(story)
+
+
+def _item_text(title: str, description: str) -> str:
+    return f"{title} {description}".strip()
+
+
+def dedupe_epics(
+    epics: List[Epic],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[Epic]:
+    """
+    Merge near-duplicate epics, then near-duplicate stories across the plan.
+
+    The earliest occurrence wins and keeps its id; later duplicates are
+    folded into it. Returns the surviving epics in their original order.
+    """
+    # Epics first, so stories of merged epics are compared as one pool
+    epic_groups = find_near_duplicates(
+        [_item_text(e.title, e.description) for e in epics], threshold
+    )
+    dropped_epics: Set[int] = set()
+    for group in epic_groups:
+        keep = epics[group[0]]
+        for index in group[1:]:
+            _merge_epic_into(keep, epics[index])
+            dropped_epics.add(index)
+    epics = [e for i, e in enumerate(epics) if i not in dropped_epics]
+
+    stories = [(epic, story) for epic in epics for story in epic.stories]
+    story_groups = find_near_duplicates(
+        [_item_text(s.title, s.description) for _, s in stories], threshold
+    )
+    dropped_story_ids: Set[int] = set()
+    for group in story_groups:
+        _, keep = stories[group[0]]
+        for index in group[1:]:
+            _, duplicate = stories[index]
+            _merge_story_into(keep, duplicate)
+            dropped_story_ids.add(id(duplicate))
+
+    if dropped_story_ids:
+        for epic in epics:
+            epic.stories = [s for s in epic.stories if id(s) not in dropped_story_ids]
+
+    merged_epics = len(dropped_epics)
+    merged_stories = len(dropped_story_ids)
+    if merged_epics or merged_stories:
+        print(f"Merged {merged_epics} duplicate epics and {merged_stories} duplicate stories.")
+
+    return epics
+
+
+def dedupe_plan(plan: Plan, threshold: float = DEFAULT_THRESHOLD) -> Plan:
+    """
+    Deduplicate an existing plan in place, e.g. after merging in a new meeting.
+
+    Sprint task lists are pruned of tasks that were dropped during merging.
+    """
+    plan.epics = dedupe_epics(plan.epics, threshold)
+
+    remaining_task_ids = {
+        task.id for epic in plan.epics for story in epic.stories for task in story.tasks
+    }
+    for sprint in plan.sprints:
+        sprint.task_ids = [t for t in sprint.task_ids if t in remaining_task_ids]
+
+    return plan
@@ -0,0 +1,265 @@
+# app/core/planning/exporters.py
+
+from __future__ import annotations
+
+import csv
+import json
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Deque, Dict, Iterator, List, Optional
+
+from app.core.planning.models import Epic, Plan, Sprint
+
+# -------------------------------------------------------------------
+# Bulk exporters
+#
+# Each exporter walks the Plan and writes to disk as it goes, flushing
+# in fixed-size chunks, so no exporter builds the whole output (or the
+# nested dict from Plan.to_dict) in memory.
+# -------------------------------------------------------------------
+
+CSV_COLUMNS = [
+    "task_id",
+    "task_title",
+    "estimate",
+    "status",
+    "labels",
+    "story_id",
+    "story_title",
+    "epic_id",
+    "epic_title",
+    "sprint_id",
+    "sprint_name",
+    "sprint_start",
+    "sprint_end",
+]
+
+DEFAULT_CHUNK_SIZE = 500
+
+
+def _sprint_by_task(plan: Plan) -> Dict[str, Sprint]:
+    """Map each task id to the sprint it was allocated to."""
+    lookup: Dict[str, Sprint] = {}
+    for sprint in plan.sprints:
+        for task_id in sprint.task_ids:
+            lookup[task_id] = sprint
+    return lookup
+
+
+def _value(enum_or_str) -> str:
+    return getattr(enum_or_str, "value", enum_or_str)
+
+
+# -----------------------------
+# CSV: one row per task
+# -----------------------------
+
+def iter_task_rows(plan: Plan) -> Iterator[List[str]]:
+    """Yield one flat row per task, in CSV_COLUMNS order."""
+    sprint_by_task = _sprint_by_task(plan)
+    for epic in plan.epics:
+        for story in epic.stories:
+            for task in story.tasks:
+                sprint = sprint_by_task.get(task.id)
+                yield [
+                    task.id,
+                    task.title,
+                    task.estimate,
+                    _value(task.status),
+                    ";".join(task.labels),
+                    story.id,
+                    story.title,
+                    epic.id,
+                    epic.title,
+                    sprint.id if sprint else "",
+                    sprint.name if sprint else "",
+                    str(sprint.start_date or "") if sprint else "",
+                    str(sprint.end_date or "") if sprint else "",
+                ]
+
+
+def export_tasks_csv(plan: Plan, path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Path:
+    """
+    Write a flat CSV of tasks with their epic, story and sprint columns.
+    """
+    path = Path(path)
+    with path.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_COLUMNS)
+        chunk: List[List[str]] = []
+        for row in iter_task_rows(plan):
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                writer.writerows(chunk)
+                chunk = []
+        if chunk:
+            writer.writerows(chunk)
+    return path
+
+
+# -----------------------------
+# Markdown roadmap
+# -----------------------------
+
+def render_epic_markdown(epic: Epic, sprint_names: Dict[str, str]) -> str:
+    """
+    Render one epic section. Epics are independent, so this can run in
+    worker threads or processes.
+    """
+    lines = [f"## {epic.title}", ""]
+    if epic.description:
+        lines += [epic.description, ""]
+    lines += [
+        f"- **ID:** {epic.id}",
+        f"- **Priority:** {_value(epic.priority)}",
+        f"- **Status:** {_value(epic.status)}",
+        "",
+    ]
+
+    for story in epic.stories:
+        lines.append(f"### {story.title}")
+        lines.append("")
+        if story.description:
+            lines += [story.description, ""]
+        if story.acceptance_criteria:
+            lines.append("Acceptance criteria:")
+            lines += [f"- {c}" for c in story.acceptance_criteria]
+            lines.append("")
+        for task in story.tasks:
+            done = "x" if _value(task.status) == "done" else " "
+            sprint = sprint_names.get(task.id, "unscheduled")
+            lines.append(f"- [{done}] {task.title} ({task.estimate}, {sprint})")
+        lines.append("")
+
+    return "\n".join(lines) + "\n"
+
+
+def _render_roadmap_header(plan: Plan) -> str:
+    lines = [f"# {plan.name}", "", plan.vision_text, "", "## Sprints", ""]
+    for sprint in plan.sprints:
+        lines.append(
+            f"- **{sprint.name}** ({sprint.start_date} → {sprint.end_date}): {sprint.goal}"
+        )
+    lines.append("")
+    return "\n".join(lines) + "\n"
+
+
+def export_markdown_roadmap(
+    plan: Plan,
+    path: Path,
+    workers: int = 4,
+    executor: Optional[Executor] = None,
+) -> Path:
+    """
+    Write a Markdown roadmap: plan header, sprint list, then one section per epic.
+
+    Epic sections are rendered on an executor (threads by default; pass a
+    ProcessPoolExecutor for CPU-bound plans). At most ``2 * workers``
+    sections are in flight, and they are written in plan order.
+    """
+    path = Path(path)
+    sprint_names = {task_id: s.name for task_id, s in _sprint_by_task(plan).items()}
+    window = max(1, 2 * workers)
+
+    owns_executor = executor is None
+    if executor is None:
+        executor = ThreadPoolExecutor(max_workers=workers)
+
+    try:
+        with path.open("w", encoding="utf-8") as f:
+            f.write(_render_roadmap_header(plan))
+            pending: Deque = deque()
+            for epic in plan.epics:
+                # Only this epic's tasks: with a process pool every argument
+                # is pickled per submit, so the plan-wide map would cost
+                # O(epics x tasks)
+                epic_sprints = {
+                    task.id: sprint_names[task.id]
+                    for story in epic.stories
+                    for task in story.tasks
+                    if task.id in sprint_names
+                }
+                pending.append(executor.submit(render_epic_markdown, epic, epic_sprints))
+                if len(pending) >= window:
+                    f.write(pending.popleft().result())
+            while pending:
+                f.write(pending.popleft().result())
+    finally:
+        if owns_executor:
+            executor.shutdown()
+    return path
+
+
+# -----------------------------
+# Issue tracker bulk import (JSON Lines)
+# -----------------------------
+
+def iter_issue_records(plan: Plan) -> Iterator[dict]:
+    """
+    Yield one issue per epic, story and task, parents before children.
+    """
+    sprint_by_task = _sprint_by_task(plan)
+    for epic in plan.epics:
+        yield {
+            "external_id": epic.id,
+            "issue_type": "Epic",
+            "summary": epic.title,
+            "description": epic.description,
+            "priority": _value(epic.priority),
+            "status": _value(epic.status),
+            "parent": None,
+            "labels": [],
+        }
+        for story in epic.stories:
+            description = story.description
+            if story.acceptance_criteria:
+                criteria = "\n".join(f"- {c}" for c in story.acceptance_criteria)
+                description = f"{description}\n\nAcceptance criteria:\n{criteria}".strip()
+            yield {
+                "external_id": story.id,
+                "issue_type": "Story",
+                "summary": story.title,
+                "description": description,
+                "priority": _value(story.priority),
+                "status": _value(story.status),
+                "parent": epic.id,
+                "labels": [],
+            }
+            for task in story.tasks:
+                sprint = sprint_by_task.get(task.id)
+                yield {
+                    "external_id": task.id,
+                    "issue_type": "Sub-task",
+                    "summary": task.title,
+                    "description": task.description,
+                    "status": _value(task.status),
+                    "estimate": task.estimate,
+                    "parent": story.id,
+                    "labels": list(task.labels),
+                    "sprint": sprint.name if sprint else None,
+                }
+
+
+def export_issues_jsonl(plan: Plan, path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Path:
+    """
+    Write a JSON Lines file for bulk issue import, one issue per line.
+    """
+    path = Path(path)
+    with path.open("w", encoding="utf-8") as f:
+        chunk: List[str] = []
+        for record in iter_issue_records(plan):
+            chunk.append(json.dumps(record, default=str))
+            if len(chunk) >= chunk_size:
+                f.write("\n".join(chunk) + "\n")
+                chunk = []
+        if chunk:
+            f.write("\n".join(chunk) + "\n")
+    return path
+
+
+EXPORTERS = {
+    "csv": export_tasks_csv,
+    "markdown": export_markdown_roadmap,
+    "jsonl": export_issues_jsonl,
+}
@@ -0,0 +1,246 @@
+# app/core/planning/forecasting.py
+
+from __future__ import annotations
+
+import datetime as dt
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.planning.models import ESTIMATE_POINTS, Plan, Status, Task
+
+# -------------------------------------------------------------------
+# Monte Carlo delivery forecasting
+#
+# Remaining tasks are worked through in sprint allocation order. Each
+# simulation draws the actual size of the work (per estimate size) and
+# the throughput of every future sprint, then finds the sprint in which
+# cumulative throughput first covers the work up to the end of each
+# epic. Task sizes are only summed per epic segment (normal
+# approximation of a sum of independent tasks), so the simulation
+# matrices are (simulations x epics) and (simulations x sprints), not
+# (simulations x tasks). Sprint matrices are built and searched one block
+# of simulations at a time, so peak memory does not grow with the number
+# of simulations.
+# -------------------------------------------------------------------
+
+DEFAULT_SIMULATIONS = 20_000
+DEFAULT_PERCENTILES = (50, 85, 95)
+SPRINT_LENGTH_DAYS = 14
+
+# Relative spread of actual effort around the nominal points of each size
+ESTIMATE_SPREAD = {"S": 0.5, "M": 0.4, "L": 0.35}
+
+# Velocity prior when no history is given: planned points per sprint +/- 25%
+PRIOR_VELOCITY_CV = 0.25
+_MIN_VELOCITY = 0.5
+
+# Simulations handled per block: keeps the (rows x sprints) capacity
+# matrix cache-sized and bounds peak memory on long plans
+_BLOCK_ROWS = 1_000
+
+
+@dataclass
+class Forecast:
+    simulations: int
+    percentiles: Tuple[int, ...]
+    remaining_points: float
+    plan: Dict[int, dt.date] = field(default_factory=dict)
+    epics: Dict[str, Dict[int, dt.date]] = field(default_factory=dict)
+
+
+def _ordered_tasks(plan: Plan) -> Tuple[List[Task], Dict[str, str]]:
+    """
+    Tasks in the order they will be worked: sprint order first, then any
+    unallocated tasks in plan order. Also returns task id -> epic id.
+    """
+    tasks_by_id: Dict[str, Task] = {}
+    epic_by_task: Dict[str, str] = {}
+    for epic in plan.epics:
+        for story in epic.stories:
+            for task in story.tasks:
+                tasks_by_id[task.id] = task
+                epic_by_task[task.id] = epic.id
+
+    ordered: List[Task] = []
+    seen = set()
+    for sprint in plan.sprints:
+        for task_id in sprint.task_ids:
+            if task_id in tasks_by_id and task_id not in seen:
+                ordered.append(tasks_by_id[task_id])
+                seen.add(task_id)
+    for task_id, task in tasks_by_id.items():
+        if task_id not in seen:
+            ordered.append(task)
+    return ordered, epic_by_task
+
+
+def _planned_velocity(plan: Plan) -> float:
+    """Typical (median) points per sprint as allocated by _allocate_sprints."""
+    points = []
+    tasks = {
+        t.id: t for e in plan.epics for s in e.stories for t in s.tasks
+    }
+    for sprint in plan.sprints:
+        if sprint.task_ids:
+            points.append(
+                sum(ESTIMATE_POINTS.get(tasks[t].estimate, 3) for t in sprint.task_ids if t in tasks)
+            )
+    return float(np.median(points)) if points else 10.0
+
+
+def _start_date(plan: Plan, today: dt.date) -> dt.date:
+    """Forecast from the current sprint's start, or from today."""
+    for sprint in plan.sprints:
+        if sprint.start_date and sprint.end_date and sprint.start_date <= today <= sprint.end_date:
+            return sprint.start_date
+    return today
+
+
+def _finishing_sprints(capacity: np.ndarray, work: np.ndarray) -> np.ndarray:
+    """
+    Index of the first sprint whose cumulative capacity covers each
+    cumulative work checkpoint, per row. Every row is sorted, so shifting
+    row r by r * span (span > any value) makes the block one sorted array
+    and a single searchsorted answers every (row, checkpoint) pair in
+    O(rows * checkpoints * log(rows * sprints)). float32 values plus an
+    integer offset are exact in float64, so ties resolve as in a per-row
+    search.
+    """
+    rows, n_sprints = capacity.shape
+    span = float(np.ceil(max(capacity[:, -1].max(), work.max()))) + 1.0
+    offsets = np.arange(rows, dtype=np.float64)[:, None] * span
+    flat = np.searchsorted((capacity + offsets).ravel(), (work + offsets).ravel(), side="left")
+    return flat.reshape(work.shape) - np.arange(rows)[:, None] * n_sprints
+
+
+def _column_percentiles(finish: np.ndarray, percentiles: Sequence[int]) -> np.ndarray:
+    """
+    np.percentile(finish, percentiles, axis=0, method="higher") for small
+    non-negative ints, from per-column counts instead of a partition of
+    the whole matrix. Returns (percentiles x columns).
+    """
+    simulations, columns = finish.shape
+    n_values = int(finish.max()) + 1
+    keys = (finish + np.arange(columns) * n_values).ravel()
+    counts = np.bincount(keys, minlength=columns * n_values).reshape(columns, n_values)
+    cumulative = np.cumsum(counts, axis=1)
+    # "higher" takes the sorted value at index ceil(p / 100 * (n - 1)): the
+    # smallest value whose cumulative count exceeds that index
+    ranks = np.ceil(np.asarray(percentiles, dtype=float) / 100 * (simulations - 1)).astype(np.int64)
+    return (cumulative[None, :, :] <= ranks[:, None, None]).sum(axis=2)
+
+
+def forecast_plan(
+    plan: Plan,
+    velocity_history: Optional[Sequence[float]] = None,
+    simulations: int = DEFAULT_SIMULATIONS,
+    percentiles: Sequence[int] = DEFAULT_PERCENTILES,
+    today: Optional[dt.date] = None,
+    seed: Optional[int] = None,
+) -> Forecast:
+    """
+    Simulate delivery of the remaining (not done) work of a plan.
+
+    With ``velocity_history`` (points completed per past sprint) future
+    sprint throughput is bootstrapped from it; otherwise it is drawn from
+    a normal prior centred on the plan's allocated points per sprint.
+    Returns completion dates (end of the finishing sprint) per percentile
+    for the whole plan and for every epic with remaining work.
+    """
+    today = today or dt.date.today()
+    rng = np.random.default_rng(seed)
+    percentiles = tuple(percentiles)
+
+    ordered, epic_by_task = _ordered_tasks(plan)
+    remaining = [t for t in ordered if t.status != Status.DONE]
+
+    # Split the remaining work into segments ending at each epic's last task.
+    # Each segment is summarised by its per-size task counts.
+    sizes = list(ESTIMATE_POINTS)
+    last_position = {epic_by_task[t.id]: i for i, t in enumerate(remaining)}
+    checkpoints = sorted(set(last_position.values()))
+    counts = np.zeros((len(checkpoints), len(sizes)))
+    segment = 0
+    for i, task in enumerate(remaining):
+        size = task.estimate if task.estimate in ESTIMATE_POINTS else "M"
+        counts[segment, sizes.index(size)] += 1
+        if i == checkpoints[segment]:
+            segment += 1
+
+    nominal = np.array([ESTIMATE_POINTS[s] for s in sizes], dtype=float)
+    spread = np.array([ESTIMATE_SPREAD.get(s, 0.4) for s in sizes]) * nominal
+    remaining_points = float((counts @ nominal).sum())
+
+    forecast = Forecast(simulations, percentiles, remaining_points)
+    start = _start_date(plan, today)
+    if not checkpoints:
+        forecast.plan = {p: start for p in percentiles}
+        return forecast
+
+    # Work per segment ~ Normal(sum of means, sum of variances), then cumulative.
+    # float32 halves the memory traffic of the largest matrices.
+    seg_mean = (counts @ nominal).astype(np.float32)
+    seg_std = np.sqrt(counts @ spread ** 2).astype(np.float32)
+    work = rng.standard_normal(size=(simulations, len(checkpoints)), dtype=np.float32)
+    work *= seg_std
+    work += seg_mean
+    np.maximum(work, 0.0, out=work)
+    np.cumsum(work, axis=1, out=work)
+
+    # velocity_history may be a NumPy array, so test its length, not its truth
+    has_history = velocity_history is not None and len(velocity_history) > 0
+    if has_history:
+        history = np.maximum(np.asarray(velocity_history, dtype=float), _MIN_VELOCITY)
+        mean_velocity = float(history.mean())
+        history32 = history.astype(np.float32)
+    else:
+        mean_velocity = _planned_velocity(plan)
+
+    def draw(rows: int, n_sprints: int) -> np.ndarray:
+        if has_history:
+            # Small index dtype: the index matrix is as large as the draws
+            index_dtype = np.uint8 if len(history32) <= 256 else np.int64
+            return history32[rng.integers(0, len(history32), size=(rows, n_sprints), dtype=index_dtype)]
+        draws = rng.standard_normal(size=(rows, n_sprints), dtype=np.float32)
+        draws *= np.float32(mean_velocity * PRIOR_VELOCITY_CV)
+        draws += np.float32(mean_velocity)
+        return np.maximum(draws, np.float32(_MIN_VELOCITY), out=draws)
+
+    # Sprint throughput draws, one block of simulations at a time. Each
+    # block starts with enough sprints for its largest amount of work even
+    # if velocity runs three standard deviations low (n * mean - 3 *
+    # sqrt(n) * std >= work), and is extended only if some simulation of
+    # the block has still not finished.
+    velocity_std = float(history.std()) if has_history else mean_velocity * PRIOR_VELOCITY_CV
+    finish = np.empty(work.shape, dtype=np.int32)
+    for lo in range(0, simulations, _BLOCK_ROWS):
+        block = work[lo:lo + _BLOCK_ROWS]
+        most_work = float(block[:, -1].max())
+        sqrt_n = (
+            3 * velocity_std + np.sqrt(9 * velocity_std ** 2 + 4 * mean_velocity * most_work)
+        ) / (2 * mean_velocity)
+        horizon = int(np.ceil(sqrt_n ** 2)) + 1
+        capacity = np.cumsum(draw(len(block), horizon), axis=1)
+        while (capacity[:, -1] < block[:, -1]).any():
+            extra = max(capacity.shape[1] // 8, 1)
+            more = np.cumsum(draw(len(block), extra), axis=1) + capacity[:, -1:]
+            capacity = np.concatenate([capacity, more], axis=1)
+        finish[lo:lo + len(block)] = _finishing_sprints(capacity, block)
+
+    def to_date(sprint_index: float) -> dt.date:
+        return start + dt.timedelta(days=(int(sprint_index) + 1) * SPRINT_LENGTH_DAYS - 1)
+
+    # One percentile pass over every checkpoint column: (percentiles x checkpoints)
+    table = _column_percentiles(finish, percentiles)
+
+    def summarize(column: int) -> Dict[int, dt.date]:
+        return {p: to_date(v) for p, v in zip(percentiles, table[:, column])}
+
+    forecast.plan = summarize(len(checkpoints) - 1)
+    column_of = {pos: col for col, pos in enumerate(checkpoints)}
+    for epic in plan.epics:
+        if epic.id in last_position:
+            forecast.epics[epic.id] = summarize(column_of[last_position[epic.id]])
+    return forecast
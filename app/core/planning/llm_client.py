@@ -0,0 +1,395 @@
+# app/core/planning/llm_client.py
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+import requests
+
+# -------------------------------------------------------------------
+# Resilient calls to local Ollama instances
+#
+# One prompt goes through: model choice (fall back to a smaller model
+# under load) -> jittered retries -> hedged requests across the healthy
+# backends, first response wins. Each backend has its own circuit
+# breaker per model, so a dead instance (or a model it cannot serve)
+# stops receiving traffic. Counters record which path served every call.
+#
+# Responses are streamed, and every request runs on a daemon thread with
+# its own cancel flag. Once a hedge wins, the others stop at their next
+# streamed chunk and close their connection, which makes Ollama stop
+# generating. A losing request neither keeps a GPU busy nor holds up
+# interpreter exit.
+# -------------------------------------------------------------------
+
+DEFAULT_HOSTS = "http://localhost:11434"
+DEFAULT_MODEL = "llama3.2:latest"
+DEFAULT_FALLBACK_MODEL = "llama3.2:1b"
+
+# Paths recorded in LLMClient.stats
+PATH_PRIMARY = "primary"
+PATH_HEDGED = "hedged"
+PATH_RETRY = "retry"
+PATH_FALLBACK_MODEL = "fallback_model"
+PATH_FAILED = "failed"
+
+
+class LLMUnavailableError(RuntimeError):
+    """Raised when no backend produced a response within the call policy."""
+
+
+class _RequestCancelled(Exception):
+    """A request stopped because another hedge already answered."""
+
+
+@dataclass
+class CallPolicy:
+    deadline: float = 120.0          # overall budget of one generate() call, seconds
+    fallback_reserve: float = 30.0   # part of the deadline kept back for the fallback model
+    timeout: float = 60.0            # per request, seconds (capped by the deadline)
+    max_attempts: int = 3            # retries of the whole hedged call
+    backoff_base: float = 0.5        # seconds, doubled per attempt
+    backoff_max: float = 8.0
+    hedge_delay: float = 15.0        # wait this long before asking the next backend
+    failure_threshold: int = 3       # consecutive failures that open a breaker
+    reset_timeout: float = 30.0      # seconds before an open breaker lets a probe through
+    overload_in_flight: int = 4      # concurrent calls at which we switch to the fallback model
+
+
+@dataclass
+class OllamaBackend:
+    url: str
+
+    @property
+    def generate_url(self) -> str:
+        return self.url.rstrip("/") + "/api/generate"
+
+
+class CircuitBreaker:
+    """Closed -> open after N consecutive failures -> half-open after a cool-down."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_timeout: float) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """
+        Ask to send one request. Only call this when actually launching it:
+        an open breaker past its cool-down hands out a single half-open
+        probe, and the caller must report that request's outcome.
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                # Let exactly one probe through
+                self.state = self.HALF_OPEN
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    def release_probe(self) -> None:
+        """A probe was cancelled before it had an outcome: let the next caller probe."""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self.state = self.OPEN
+
+
+class LLMClient:
+    """Ollama client with retries, per-backend circuit breakers and hedging."""
+
+    def __init__(
+        self,
+        backends: List[OllamaBackend],
+        model: str = DEFAULT_MODEL,
+        fallback_model: Optional[str] = DEFAULT_FALLBACK_MODEL,
+        policy: Optional[CallPolicy] = None,
+    ) -> None:
+        if not backends:
+            raise ValueError("LLMClient needs at least one backend.")
+        self.backends = backends
+        self.model = model
+        self.fallback_model = fallback_model
+        self.policy = policy or CallPolicy()
+        self.breakers: Dict[Tuple[str, str], CircuitBreaker] = {}
+        self.stats: Counter = Counter()
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        # Cancel flags of the requests currently on the wire
+        self._requests: Set[threading.Event] = set()
+
+    @classmethod
+    def from_env(cls) -> "LLMClient":
+        """
+        Build a client from OLLAMA_HOSTS (comma separated), OLLAMA_MODEL and
+        OLLAMA_FALLBACK_MODEL (empty disables the fallback model).
+        """
+        hosts = os.environ.get("OLLAMA_HOSTS", DEFAULT_HOSTS)
+        backends = [OllamaBackend(h.strip()) for h in hosts.split(",") if h.strip()]
+        fallback = os.environ.get("OLLAMA_FALLBACK_MODEL", DEFAULT_FALLBACK_MODEL) or None
+        return cls(
+            backends,
+            model=os.environ.get("OLLAMA_MODEL", DEFAULT_MODEL),
+            fallback_model=fallback,
+        )
+
+    # -----------------------------
+    # Public API
+    # -----------------------------
+
+    def generate(self, prompt: str) -> Tuple[str, str]:
+        """
+        Return (response text, path) where path says how the call was served.
+        """
+        with self._lock:
+            self._in_flight += 1
+            overloaded = self._in_flight > self.policy.overload_in_flight
+
+        # One deadline covers the retries of the main model and the fallback
+        # model, so the worst case is policy.deadline rather than a multiple
+        # of the per-request timeout.
+        deadline = time.monotonic() + self.policy.deadline
+        try:
+            model = self.model
+            if overloaded and self.fallback_model:
+                model = self.fallback_model
+
+            try:
+                primary_deadline = deadline
+                if model != self.fallback_model and self.fallback_model:
+                    primary_deadline = deadline - self.policy.fallback_reserve
+                text, path = self._generate_with_retries(prompt, model, primary_deadline)
+            except LLMUnavailableError:
+                if model == self.fallback_model or not self.fallback_model:
+                    raise
+                # Primary model exhausted its share of the deadline, try the lighter one
+                text, _ = self._generate_with_retries(prompt, self.fallback_model, deadline)
+                path = PATH_FALLBACK_MODEL
+
+            if model == self.fallback_model:
+                path = PATH_FALLBACK_MODEL
+            self.stats[path] += 1
+            return text, path
+        except LLMUnavailableError:
+            self.stats[PATH_FAILED] += 1
+            raise
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def close(self) -> None:
+        """Cancel every request still running, e.g. losing hedges at exit."""
+        with self._lock:
+            requests_in_flight = list(self._requests)
+        for cancel in requests_in_flight:
+            cancel.set()
+
+    # -----------------------------
+    # Internals
+    # -----------------------------
+
+    def _generate_with_retries(self, prompt: str, model: str, deadline: float) -> Tuple[str, str]:
+        last_error: Optional[Exception] = None
+        attempts = 0
+        for attempt in range(self.policy.max_attempts):
+            if attempt:
+                # Full jitter: sleep uniformly in [0, capped exponential backoff]
+                cap = min(self.policy.backoff_max, self.policy.backoff_base * 2 ** attempt)
+                time.sleep(min(random.uniform(0, cap), max(deadline - time.monotonic(), 0.0)))
+            if time.monotonic() >= deadline:
+                break
+            attempts += 1
+            try:
+                text, hedged = self._hedged_call(prompt, model, deadline)
+            except LLMUnavailableError as e:
+                last_error = e
+                continue
+
+            if hedged:
+                return text, PATH_HEDGED
+            return text, PATH_RETRY if attempt else PATH_PRIMARY
+
+        raise LLMUnavailableError(
+            f"No response from {model} after {attempts} attempts: {last_error or 'deadline reached'}"
+        )
+
+    def _breaker(self, backend: OllamaBackend, model: str) -> CircuitBreaker:
+        key = (backend.url, model)
+        with self._lock:
+            if key not in self.breakers:
+                self.breakers[key] = CircuitBreaker(
+                    self.policy.failure_threshold, self.policy.reset_timeout
+                )
+            return self.breakers[key]
+
+    def _call_backend(
+        self, backend: OllamaBackend, prompt: str, model: str, timeout: float, cancel: threading.Event
+    ) -> str:
+        """
+        Stream one generation. Between chunks, stop if the request was
+        cancelled or ran past its timeout. Leaving the `with` block closes
+        the connection, and Ollama stops generating for a closed client.
+        """
+        started = time.monotonic()
+        parts: List[str] = []
+        with requests.post(
+            backend.generate_url,
+            json={"model": model, "prompt": prompt, "stream": True},
+            timeout=timeout,
+            stream=True,
+        ) as resp:
+            resp.raise_for_status()
+            for line in resp.iter_lines():
+                if cancel.is_set():
+                    raise _RequestCancelled(backend.url)
+                if time.monotonic() - started > timeout:
+                    raise requests.Timeout(f"no complete response within {timeout:.1f}s")
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                if chunk.get("error"):
+                    raise RuntimeError(chunk["error"])
+                parts.append(chunk.get("response", ""))
+                if chunk.get("done"):
+                    break
+        return "".join(parts)
+
+    def _start(self, fn: Callable[[threading.Event], str]) -> Tuple[Future, threading.Event]:
+        """Run one request on a daemon thread; returns its future and cancel flag."""
+        future: Future = Future()
+        cancel = threading.Event()
+        with self._lock:
+            self._requests.add(cancel)
+
+        def run() -> None:
+            try:
+                future.set_result(fn(cancel))
+            except BaseException as e:
+                future.set_exception(e)
+            finally:
+                with self._lock:
+                    self._requests.discard(cancel)
+
+        future.set_running_or_notify_cancel()
+        threading.Thread(target=run, name="llm-request", daemon=True).start()
+        return future, cancel
+
+    def _hedged_call(self, prompt: str, model: str, deadline: float) -> Tuple[str, bool]:
+        """
+        Send to the first healthy backend, adding one more backend every
+        hedge_delay seconds (or immediately after a failure). The first
+        success wins and every other request is cancelled.
+
+        Every launched request reports its outcome to its breaker from a
+        done-callback. A cancelled request has no outcome: it leaves a
+        closed breaker alone and hands a half-open probe back. Returns
+        (text, True if a hedge answered).
+        """
+        spares = self.backends[1:]
+        random.shuffle(spares)  # spread hedges across the spare backends
+        order = self.backends[:1] + spares
+
+        pending: Dict[Future, OllamaBackend] = {}
+        cancels: List[threading.Event] = []
+        errors: List[str] = []
+
+        def report(future: Future, breaker: CircuitBreaker) -> None:
+            error = future.exception()
+            if error is None:
+                breaker.record_success()
+            elif isinstance(error, _RequestCancelled):
+                breaker.release_probe()
+            else:
+                breaker.record_failure()
+
+        def launch() -> bool:
+            """Start the next backend whose breaker admits a request."""
+            while order:
+                backend = order.pop(0)
+                breaker = self._breaker(backend, model)
+                if not breaker.allow():
+                    continue
+                timeout = min(self.policy.timeout, max(deadline - time.monotonic(), 0.001))
+                future, cancel = self._start(
+                    lambda c, b=backend, t=timeout: self._call_backend(b, prompt, model, t, c)
+                )
+                future.add_done_callback(lambda f, b=breaker: report(f, b))
+                pending[future] = backend
+                cancels.append(cancel)
+                return True
+            return False
+
+        if not launch():
+            raise LLMUnavailableError("All Ollama backends have open circuit breakers.")
+        first = next(iter(pending))
+
+        try:
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    errors.append("deadline reached")
+                    break
+                timeout = min(self.policy.hedge_delay, remaining) if order else remaining
+                done, _ = wait(list(pending), timeout=timeout, return_when=FIRST_COMPLETED)
+
+                if not done:
+                    launch()
+                    continue
+
+                for future in done:
+                    backend = pending.pop(future)
+                    error = future.exception()
+                    if error is None:
+                        return future.result(), future is not first
+                    errors.append(f"{backend.url}: {error}")
+
+                if not pending:
+                    launch()
+        finally:
+            # Losing hedges (and requests past the deadline) stop here
+            for cancel in cancels:
+                cancel.set()
+
+        raise LLMUnavailableError("; ".join(errors))
+
+
+_default_client: Optional[LLMClient] = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client() -> LLMClient:
+    """Process-wide client configured from the environment."""
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = LLMClient.from_env()
+            atexit.register(_default_client.close)
+        return _default_client
@@ -31,6 +31,10 @@ class TimeHorizon(str, Enum):
     YEAR = "year"
 
 
+# Story points for each task estimate size
+ESTIMATE_POINTS = {"S": 1, "M": 3, "L": 5}
+
+
 # -----------------------------
 # Core data models
 # -----------------------------
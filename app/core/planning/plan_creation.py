@@ -7,10 +7,10 @@ import itertools
 import json
 import os
 import re
-from typing import List, Tuple
+from collections import Counter
+from typing import List, Optional, Tuple
 
 import openai
-import requests
 import textwrap
 from app.core.planning.models import (
     Plan,
@@ -22,10 +22,21 @@ from app.core.planning.models import (
     Priority,
     Status,
 )
+from app.core.planning.dedup import dedupe_epics
+from app.core.planning.llm_client import get_default_client
+from app.core.planning.sprint_summaries import SprintSummaryCache, summarize_sprints
 
 # Read API key from environment: export OPENAI_API_KEY="sk-..."
 openai.api_key = os.environ.get("OPENAI_API_KEY")
 
+# How each created plan's outline was served: primary, hedged, retry,
+# fallback_model, or minimal_plan when every LLM path failed.
+PLAN_SOURCE_COUNTS: Counter = Counter()
+
+# Sprint summaries shared by every allocation in this process. Entries are
+# keyed on all of their inputs, so sharing them across plans is safe.
+SPRINT_SUMMARY_CACHE = SprintSummaryCache()
+
 def _normalize_outline_format(outline: str) -> str:
     """
     Fix indentation and structure so parser can understand the output.
@@ -68,9 +79,9 @@ def _generate_id(prefix: str, counter: int) -> str:
 # -------------------------------------------------------------------
 
 
-def _ask_llm_for_outline(vision_text: str) -> str:
+def _ask_llm_for_outline(vision_text: str) -> Tuple[str, str]:
     """
-    Call the local Ollama LLaMA model and return a clean outline string.
+    Call the local Ollama LLaMA model and return (clean outline, served path).
     """
 
     prompt = textwrap.dedent(f"""
@@ -89,21 +100,9 @@ def _ask_llm_for_outline(vision_text: str) -> str:
     {vision_text}
     """)
 
-    # Call Ollama /api/generate, non streaming
-    resp = requests.post(
-        "http://localhost:11434/api/generate",
-        json={
-            "model": "llama3.2:latest",   # or "llama3:latest" if you prefer
-            "prompt": prompt,
-            "stream": False,
-        },
-        timeout=180,
-    )
-    resp.raise_for_status()
-    data = resp.json()
-
-    # Ollama returns the text in the 'response' field
-    raw_text = data.get("response", "")
+    # Call Ollama /api/generate through the resilient client
+    # (retries, circuit breakers, hedging across OLLAMA_HOSTS, fallback model)
+    raw_text, served_path = get_default_client().generate(prompt)
 
     print("\n================ RAW LLaMA OUTLINE ================\n")
     print(raw_text)
@@ -134,7 +133,7 @@ def _ask_llm_for_outline(vision_text: str) -> str:
     print(outline)
     print("\n=================================================================\n")
 
-    return outline
+    return outline, served_path
 
 
 # -------------------------------------------------------------------
@@ -341,6 +340,11 @@ def _parse_outline_to_models(outline: str) -> Tuple[List[Epic], List[Task]]:
     if current_epic is not None:
         epics.append(current_epic)
 
+    # ------------------------------------------------------
+    # Merge near-duplicate epics / stories before they fan out into tasks
+    # ------------------------------------------------------
+    epics = dedupe_epics(epics)
+
     # ------------------------------------------------------
     # Auto-generate tasks for each story
     # ------------------------------------------------------
@@ -436,6 +440,7 @@ def _allocate_sprints(
     tasks: List[Task],
     time_horizon: TimeHorizon,
     vision_text: str,
+    summary_cache: Optional[SprintSummaryCache] = None,
 ) -> List[Sprint]:
     total_sprints = _estimate_number_of_sprints(time_horizon)
     if total_sprints == 0:
@@ -479,61 +484,35 @@ def _allocate_sprints(
         if len(sprints[sprint_index].task_ids) >= 5 and sprint_index < total_sprints - 1:
             sprint_index += 1
 
-    # Build lookup maps to understand which epic each task belongs to
-    story_by_id = {}
-    epic_by_id = {}
-
-    for epic in epics:
-        epic_by_id[epic.id] = epic
-        for story in epic.stories:
-            story_by_id[story.id] = story
-
-    # Helper to get a short project label from the vision text
-    first_line = vision_text.strip().splitlines()[0] if vision_text.strip() else "this project"
-    if len(first_line) > 80:
-        first_line = first_line[:77] + "..."
-
-    # Set a specific goal for each sprint based on its tasks and epics
-    for i, sprint in enumerate(sprints):
-        epic_titles_in_sprint = []
-
-        for task in tasks:
-            if task.id in sprint.task_ids:
-                story = story_by_id.get(task.story_id)
-                if story:
-                    epic = epic_by_id.get(story.epic_id)
-                    if epic:
-                        epic_titles_in_sprint.append(epic.title)
-
-        # Unique epic titles, preserve order
-        seen = set()
-        unique_epic_titles = []
-        for title in epic_titles_in_sprint:
-            if title not in seen:
-                unique_epic_titles.append(title)
-                seen.add(title)
-
-        if unique_epic_titles:
-            # Only show at most three epic names
-            if len(unique_epic_titles) > 3:
-                epic_list_str = ", ".join(unique_epic_titles[:3]) + ", and others"
-            else:
-                epic_list_str = ", ".join(unique_epic_titles)
-        else:
-            epic_list_str = "key epics"
-
-        if i == 0:
-            sprint.goal = f"Foundations for '{first_line}'. Focus on {epic_list_str}."
-        elif i == 1:
-            sprint.goal = f"Core implementation for {epic_list_str}."
-        elif i == 2:
-            sprint.goal = f"Refinement and validation for {epic_list_str}."
-        else:
-            sprint.goal = f"Ongoing improvements across {epic_list_str}."
+    # Goals (and points / label mix) from one grouped pass, reusing cached
+    # summaries for sprints whose task set is unchanged
+    summaries = summarize_sprints(sprints, epics, vision_text, summary_cache)
+    for sprint, summary in zip(sprints, summaries):
+        sprint.goal = summary.goal
 
     return sprints
 
 
+def reallocate_sprints(
+    plan: Plan,
+    summary_cache: Optional[SprintSummaryCache] = None,
+) -> List[Sprint]:
+    """
+    Re-run sprint allocation for an existing plan (e.g. after tasks were
+    added from a meeting). Sprints whose tasks did not change keep their
+    summaries from SPRINT_SUMMARY_CACHE, or from summary_cache if given.
+    """
+    tasks = [task for epic in plan.epics for story in epic.stories for task in story.tasks]
+    plan.sprints = _allocate_sprints(
+        plan.epics,
+        tasks,
+        plan.time_horizon,
+        plan.vision_text,
+        summary_cache if summary_cache is not None else SPRINT_SUMMARY_CACHE,
+    )
+    return plan.sprints
+
+
 # -------------------------------------------------------------------
 # PUBLIC ENTRY POINT
 # -------------------------------------------------------------------
@@ -557,17 +536,21 @@ def create_plan_from_vision(
 
     try:
         print("Calling LLM to design plan structure...")
-        outline = _ask_llm_for_outline(vision_text)
+        outline, served_path = _ask_llm_for_outline(vision_text)
         print("Outline text returned from LLaMA:\n", outline)
         epics, all_tasks = _parse_outline_to_models(outline)
         print(f"LLM outline parsed into {len(epics)} epics and {len(all_tasks)} tasks.")
     except Exception as e:
-        # In case of any error (no key, API failure, parsing issue), fall back to a minimal plan
+        # In case of any error (all backends down, parsing issue), fall back to a minimal plan
         print(f"LLM-based plan generation failed: {e}")
         print("Falling back to a minimal single-epic plan.")
+        served_path = "minimal_plan"
         epics, all_tasks = _parse_outline_to_models("Epics:\n1. Initial Project Planning")
 
-    sprints = _allocate_sprints(epics, all_tasks, time_horizon, vision_text)
+    PLAN_SOURCE_COUNTS[served_path] += 1
+    print(f"Plan outline served by: {served_path}")
+
+    sprints = _allocate_sprints(epics, all_tasks, time_horizon, vision_text, SPRINT_SUMMARY_CACHE)
 
     plan = Plan(
         id=plan_id,
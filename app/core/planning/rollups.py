@@ -0,0 +1,365 @@
+# app/core/planning/rollups.py
+
+from __future__ import annotations
+
+import datetime as dt
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from app.core.planning.models import ESTIMATE_POINTS, Epic, Plan, Sprint, Status, Story, Task
+
+# -------------------------------------------------------------------
+# Materialized status rollups
+#
+# Counts and points by status for every story, epic and sprint and for
+# the whole plan. The tree is walked once when PlanRollups is built;
+# after that a task status or estimate change only touches the rollups
+# on its path (story, epic, sprint, plan), and Story.status /
+# Epic.status are re-derived from their rollups. The rollups (with the
+# task -> index path map, sprint and epic headings and the burndown)
+# serialize to a dict, so reports can be served without loading or
+# walking the plan again.
+# -------------------------------------------------------------------
+
+
+def _points(task: Task) -> int:
+    return ESTIMATE_POINTS.get(task.estimate, ESTIMATE_POINTS["M"])
+
+
+@dataclass
+class Rollup:
+    counts: Dict[Status, int] = field(default_factory=lambda: {s: 0 for s in Status})
+    points: Dict[Status, int] = field(default_factory=lambda: {s: 0 for s in Status})
+
+    def add(self, status: Status, points: int, sign: int = 1) -> None:
+        self.counts[status] += sign
+        self.points[status] += sign * points
+
+    @property
+    def total_tasks(self) -> int:
+        return sum(self.counts.values())
+
+    @property
+    def total_points(self) -> int:
+        return sum(self.points.values())
+
+    @property
+    def remaining_points(self) -> int:
+        return self.total_points - self.points[Status.DONE]
+
+    @property
+    def status(self) -> Status:
+        """Derived status: done when every task is done, in progress once any task moved."""
+        if self.total_tasks and self.counts[Status.DONE] == self.total_tasks:
+            return Status.DONE
+        if self.counts[Status.IN_PROGRESS] or self.counts[Status.DONE]:
+            return Status.IN_PROGRESS
+        return Status.PLANNED
+
+    def to_dict(self) -> dict:
+        return {
+            "counts": {s.value: n for s, n in self.counts.items()},
+            "points": {s.value: n for s, n in self.points.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Rollup":
+        rollup = cls()
+        for s in Status:
+            rollup.counts[s] = data["counts"].get(s.value, 0)
+            rollup.points[s] = data["points"].get(s.value, 0)
+        return rollup
+
+
+def _parse_date(value: Optional[str]) -> Optional[dt.date]:
+    return dt.date.fromisoformat(value) if value else None
+
+
+def _iso(value: Optional[dt.date]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def carried_burndown(previous: dict, plan: Plan) -> Dict[str, Dict[str, int]]:
+    """
+    Burndown samples from persisted rollups (PlanRollups.to_dict) that
+    still describe `plan`: the same plan (id and creation time) and, per
+    sprint, the same dates. A regenerated plan reuses SPRINT-1..N, so
+    matching on sprint ids alone would show the old plan's progress.
+    """
+    if previous.get("plan_id") != plan.id or previous.get("created_at") != plan.created_at.isoformat():
+        return {}
+    old_dates = {sp["id"]: (sp["start_date"], sp["end_date"]) for sp in previous.get("sprints", [])}
+    samples = previous.get("burndown", {})
+    return {
+        sprint.id: samples[sprint.id]
+        for sprint in plan.sprints
+        if sprint.id in samples
+        and old_dates.get(sprint.id) == (_iso(sprint.start_date), _iso(sprint.end_date))
+    }
+
+
+class PlanRollups:
+    """
+    Rollups over a Plan, kept current through set_task_status /
+    set_task_estimate. Reads (standup_report, burndown) need no plan;
+    updates need the plan attached, either from the constructor or
+    with attach().
+    """
+
+    def __init__(self, plan: Plan, burndown: Optional[Dict[str, Dict[str, int]]] = None) -> None:
+        self.plan: Optional[Plan] = plan
+        self.plan_id = plan.id
+        self.created_at = plan.created_at.isoformat()
+        self.name = plan.name
+        self.plan_rollup = Rollup()
+        self.stories: Dict[str, Rollup] = {}
+        self.epics: Dict[str, Rollup] = {}
+        self.sprints: Dict[str, Rollup] = {}
+        # sprint id -> {ISO date: remaining points at the end of that day}
+        self.burndown: Dict[str, Dict[str, int]] = burndown if burndown is not None else {}
+
+        # Headings for reports, without the tree below them
+        self.sprint_info: List[Sprint] = [
+            Sprint(id=sp.id, name=sp.name, start_date=sp.start_date, end_date=sp.end_date, goal=sp.goal)
+            for sp in plan.sprints
+        ]
+        self.epic_titles: Dict[str, str] = {epic.id: epic.title for epic in plan.epics}
+        self._sprint_pos: Dict[str, int] = {sp.id: i for i, sp in enumerate(plan.sprints)}
+
+        # task id -> (epic index, story index, task index, sprint id or None)
+        self._paths: Dict[str, Tuple[int, int, int, Optional[str]]] = {}
+
+        sprint_of: Dict[str, str] = {}
+        for sprint in plan.sprints:
+            self.sprints[sprint.id] = Rollup()
+            for task_id in sprint.task_ids:
+                sprint_of[task_id] = sprint.id
+
+        for e, epic in enumerate(plan.epics):
+            self.epics[epic.id] = Rollup()
+            for s, story in enumerate(epic.stories):
+                self.stories[story.id] = Rollup()
+                for t, task in enumerate(story.tasks):
+                    self._paths[task.id] = (e, s, t, sprint_of.get(task.id))
+                    self._apply(task, 1)
+
+        for epic in plan.epics:
+            for story in epic.stories:
+                story.status = self.stories[story.id].status
+            epic.status = self.epics[epic.id].status
+
+    # -----------------------------
+    # Persistence
+    # -----------------------------
+
+    def to_dict(self) -> dict:
+        return {
+            "plan_id": self.plan_id,
+            "created_at": self.created_at,
+            "name": self.name,
+            "sprints": [
+                {
+                    "id": sp.id,
+                    "name": sp.name,
+                    "start_date": _iso(sp.start_date),
+                    "end_date": _iso(sp.end_date),
+                    "goal": sp.goal,
+                }
+                for sp in self.sprint_info
+            ],
+            "epic_titles": self.epic_titles,
+            "task_paths": {task_id: list(path) for task_id, path in self._paths.items()},
+            "rollups": {
+                "plan": self.plan_rollup.to_dict(),
+                "stories": {k: r.to_dict() for k, r in self.stories.items()},
+                "epics": {k: r.to_dict() for k, r in self.epics.items()},
+                "sprints": {k: r.to_dict() for k, r in self.sprints.items()},
+            },
+            "burndown": self.burndown,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict, plan: Optional[Plan] = None) -> "PlanRollups":
+        """Restore persisted rollups without walking the plan."""
+        rollups = cls.__new__(cls)
+        rollups.plan = plan
+        rollups.plan_id = data["plan_id"]
+        rollups.created_at = data["created_at"]
+        rollups.name = data["name"]
+        rollups.sprint_info = [
+            Sprint(
+                id=sp["id"],
+                name=sp["name"],
+                start_date=_parse_date(sp["start_date"]),
+                end_date=_parse_date(sp["end_date"]),
+                goal=sp["goal"],
+            )
+            for sp in data["sprints"]
+        ]
+        rollups.epic_titles = dict(data["epic_titles"])
+        rollups._sprint_pos = {sp.id: i for i, sp in enumerate(rollups.sprint_info)}
+        rollups._paths = {task_id: tuple(path) for task_id, path in data["task_paths"].items()}
+        stored = data["rollups"]
+        rollups.plan_rollup = Rollup.from_dict(stored["plan"])
+        rollups.stories = {k: Rollup.from_dict(v) for k, v in stored["stories"].items()}
+        rollups.epics = {k: Rollup.from_dict(v) for k, v in stored["epics"].items()}
+        rollups.sprints = {k: Rollup.from_dict(v) for k, v in stored["sprints"].items()}
+        rollups.burndown = data.get("burndown", {})
+        return rollups
+
+    def attach(self, plan: Plan) -> None:
+        """Attach the plan these rollups describe, so tasks can be updated."""
+        if plan.id != self.plan_id or plan.created_at.isoformat() != self.created_at:
+            raise ValueError(f"These rollups were built for another plan than {plan.id}.")
+        self.plan = plan
+
+    # -----------------------------
+    # Incremental updates
+    # -----------------------------
+
+    def _nodes(self, task_id: str) -> Tuple[Epic, Story, Task, Optional[str]]:
+        """
+        Follow a task's index path: O(depth), no search. Paths are only
+        valid for the tree the rollups were built from, so a path that no
+        longer leads to this task (epics merged, tasks added or moved,
+        sprints reallocated) raises instead of updating the wrong node.
+        """
+        if self.plan is None:
+            raise RuntimeError("Attach the plan before updating tasks.")
+        try:
+            e, s, t, sprint_id = self._paths[task_id]
+        except KeyError:
+            raise KeyError(f"Unknown task id: {task_id}") from None
+        try:
+            epic = self.plan.epics[e]
+            story = epic.stories[s]
+            task: Optional[Task] = story.tasks[t]
+        except IndexError:
+            task = None
+        if task is None or task.id != task_id or not self._in_sprint(task_id, sprint_id):
+            raise ValueError(
+                f"{task_id} is no longer where these rollups expect it; rebuild them from the plan."
+            )
+        return epic, story, task, sprint_id
+
+    def _in_sprint(self, task_id: str, sprint_id: Optional[str]) -> bool:
+        if sprint_id is None:
+            return True
+        pos = self._sprint_pos.get(sprint_id)
+        if pos is None or pos >= len(self.plan.sprints):
+            return False
+        sprint = self.plan.sprints[pos]
+        return sprint.id == sprint_id and task_id in sprint.task_ids
+
+    def _path(self, task: Task) -> List[Rollup]:
+        e, s, _, sprint_id = self._paths[task.id]
+        epic = self.plan.epics[e]
+        path = [self.plan_rollup, self.stories[epic.stories[s].id], self.epics[epic.id]]
+        if sprint_id is not None:
+            path.append(self.sprints[sprint_id])
+        return path
+
+    def _apply(self, task: Task, sign: int) -> None:
+        points = _points(task)
+        for rollup in self._path(task):
+            rollup.add(task.status, points, sign)
+
+    def _refresh(self, epic: Epic, story: Story, sprint_id: Optional[str], today: Optional[dt.date]) -> None:
+        """Re-derive parent statuses and record a burndown sample for the task's sprint."""
+        story.status = self.stories[story.id].status
+        epic.status = self.epics[epic.id].status
+
+        if sprint_id is not None:
+            day = (today or dt.date.today()).isoformat()
+            self.burndown.setdefault(sprint_id, {})[day] = self.sprints[sprint_id].remaining_points
+
+    def set_task_status(self, task_id: str, status: Status, today: Optional[dt.date] = None) -> Task:
+        epic, story, task, sprint_id = self._nodes(task_id)
+        self._apply(task, -1)
+        task.status = Status(status)
+        self._apply(task, 1)
+        self._refresh(epic, story, sprint_id, today)
+        return task
+
+    def set_task_estimate(self, task_id: str, estimate: str, today: Optional[dt.date] = None) -> Task:
+        if estimate not in ESTIMATE_POINTS:
+            raise ValueError(f"Unknown estimate {estimate!r}, expected one of {', '.join(ESTIMATE_POINTS)}.")
+        epic, story, task, sprint_id = self._nodes(task_id)
+        self._apply(task, -1)
+        task.estimate = estimate
+        self._apply(task, 1)
+        self._refresh(epic, story, sprint_id, today)
+        return task
+
+    # -----------------------------
+    # Reads
+    # -----------------------------
+
+    def current_sprint(self, today: Optional[dt.date] = None) -> Optional[Sprint]:
+        today = today or dt.date.today()
+        for sprint in self.sprint_info:
+            if sprint.start_date and sprint.end_date and sprint.start_date <= today <= sprint.end_date:
+                return sprint
+        return None
+
+    def sprint_burndown(self, sprint: Sprint, today: Optional[dt.date] = None) -> List[tuple]:
+        """
+        (date, ideal remaining, actual remaining or None) for each day of the
+        sprint up to today. Actual carries the last recorded sample forward.
+        """
+        today = today or dt.date.today()
+        rollup = self.sprints[sprint.id]
+        samples = self.burndown.get(sprint.id, {})
+        total = rollup.total_points
+        length = (sprint.end_date - sprint.start_date).days or 1
+
+        rows = []
+        actual: Optional[int] = None
+        day = sprint.start_date
+        while day <= min(today, sprint.end_date):
+            elapsed = (day - sprint.start_date).days
+            actual = samples.get(day.isoformat(), actual)
+            if day == today and actual is None:
+                actual = rollup.remaining_points
+            rows.append((day, round(total * (1 - elapsed / length), 1), actual))
+            day += dt.timedelta(days=1)
+        return rows
+
+    def standup_report(self, today: Optional[dt.date] = None) -> str:
+        """Plan, current sprint (with burndown) and per-epic progress."""
+        today = today or dt.date.today()
+        lines: List[str] = []
+
+        def progress(label: str, rollup: Rollup) -> str:
+            pct = 100 * rollup.points[Status.DONE] / rollup.total_points if rollup.total_points else 0
+            return (
+                f"{label:<40} {rollup.status.value:<12} "
+                f"{rollup.counts[Status.DONE]}/{rollup.total_tasks} tasks  "
+                f"{rollup.points[Status.DONE]}/{rollup.total_points} pts ({pct:.0f}%)  "
+                f"in progress: {rollup.counts[Status.IN_PROGRESS]}"
+            )
+
+        lines.append(f"=== STANDUP {today.isoformat()} — {self.name} ===")
+        lines.append(progress("Plan", self.plan_rollup))
+
+        sprint = self.current_sprint(today)
+        lines.append("")
+        if sprint is None:
+            lines.append("No sprint is running today.")
+        else:
+            lines.append(f"--- {sprint.name} ({sprint.start_date} → {sprint.end_date}) ---")
+            lines.append(f"Goal: {sprint.goal}")
+            lines.append(progress("Sprint", self.sprints[sprint.id]))
+            lines.append("")
+            lines.append("Burndown (remaining points):")
+            for day, ideal, actual in self.sprint_burndown(sprint, today):
+                shown = "-" if actual is None else str(actual)
+                bar = "#" * int(actual or 0)
+                lines.append(f"  {day}  ideal {ideal:>6}  actual {shown:>4}  {bar}")
+
+        lines.append("")
+        lines.append("Epics:")
+        for epic_id, title in self.epic_titles.items():
+            lines.append("  " + progress(title[:40], self.epics[epic_id]))
+
+        return "\n".join(lines)
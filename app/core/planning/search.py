@@ -0,0 +1,209 @@
+# app/core/planning/search.py
+
+from __future__ import annotations
+
+import hashlib
+import re
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+# -------------------------------------------------------------------
+# Full-text search over saved plans
+#
+# A SQLite FTS5 index over epics, stories and tasks of every plan in
+# the workspace, stored next to the plans. SQLite keeps the inverted
+# index on disk, so a save only rewrites the rows of the documents that
+# changed and a query reads just the postings it needs, instead of
+# loading the whole index. Documents carry a content fingerprint and
+# save_plan only re-indexes those whose fingerprint changed.
+# -------------------------------------------------------------------
+
+INDEX_FILENAME = "search_index.db"
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_STOPWORDS = {
+    "a", "an", "and", "as", "at", "be", "by", "for", "from", "i", "in", "is",
+    "it", "of", "on", "or", "so", "that", "the", "this", "to", "we", "with",
+}
+_TITLE_WEIGHT = 2.0  # bm25 column weight of titles relative to bodies
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    rowid INTEGER PRIMARY KEY,
+    key TEXT UNIQUE NOT NULL,
+    plan TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    doc_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    fingerprint TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS docs_plan ON docs (plan);
+CREATE VIRTUAL TABLE IF NOT EXISTS docs_fts USING fts5 (title, body);
+"""
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric tokens with common stopwords removed."""
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in _STOPWORDS]
+
+
+@dataclass
+class SearchHit:
+    plan: str
+    kind: str  # epic, story or task
+    id: str
+    title: str
+    score: float
+
+
+def _iter_plan_documents(plan: dict) -> Iterator[Tuple[str, str, str, str]]:
+    """Yield (kind, id, title, body) for every epic, story and task in a plan dict."""
+    for epic in plan.get("epics", []):
+        yield "epic", epic.get("id", ""), epic.get("title", ""), epic.get("description", "")
+        for story in epic.get("stories", []):
+            body = " ".join(
+                [story.get("description", "")] + list(story.get("acceptance_criteria", []))
+            )
+            yield "story", story.get("id", ""), story.get("title", ""), body
+            for task in story.get("tasks", []):
+                body = " ".join([task.get("description", "")] + list(task.get("labels", [])))
+                yield "task", task.get("id", ""), task.get("title", ""), body
+
+
+def _fingerprint(title: str, body: str) -> str:
+    return hashlib.sha1(f"{title}\x00{body}".encode("utf-8")).hexdigest()
+
+
+def _match_expression(query: str) -> str:
+    """
+    Turn a user query into an FTS5 MATCH expression. Terms are OR-ed;
+    "alert*" becomes a prefix query. Tokens are re-quoted so user input
+    cannot inject FTS5 syntax.
+    """
+    terms = []
+    for raw in query.lower().split():
+        is_prefix = raw.endswith("*")
+        for token in tokenize(raw):
+            terms.append(f'"{token}"*' if is_prefix else f'"{token}"')
+    return " OR ".join(terms)
+
+
+class SearchIndex:
+    """Persistent full-text index with BM25 ranking and prefix queries."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "SearchIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM docs").fetchone()[0]
+
+    # -----------------------------
+    # Mutation
+    # -----------------------------
+
+    def upsert(self, plan: str, kind: str, doc_id: str, title: str, body: str) -> bool:
+        """
+        Add or refresh one document. Returns False if its content is unchanged.
+        """
+        with self._conn:
+            return self._upsert(plan, kind, doc_id, title, body, None)
+
+    def _upsert(self, plan, kind, doc_id, title, body, known) -> bool:
+        key = f"{plan}:{doc_id}"
+        fingerprint = _fingerprint(title, body)
+        if known is None:
+            row = self._conn.execute(
+                "SELECT rowid, fingerprint FROM docs WHERE key = ?", (key,)
+            ).fetchone()
+        else:
+            row = known.get(key)
+        if row is not None and row[1] == fingerprint:
+            return False
+        if row is not None:
+            self._delete_row(row[0])
+
+        cur = self._conn.execute(
+            "INSERT INTO docs (key, plan, kind, doc_id, title, fingerprint) VALUES (?, ?, ?, ?, ?, ?)",
+            (key, plan, kind, doc_id, title, fingerprint),
+        )
+        self._conn.execute(
+            "INSERT INTO docs_fts (rowid, title, body) VALUES (?, ?, ?)",
+            (cur.lastrowid, title, body),
+        )
+        return True
+
+    def _delete_row(self, rowid: int) -> None:
+        self._conn.execute("DELETE FROM docs WHERE rowid = ?", (rowid,))
+        self._conn.execute("DELETE FROM docs_fts WHERE rowid = ?", (rowid,))
+
+    def remove(self, key: str) -> None:
+        with self._conn:
+            row = self._conn.execute("SELECT rowid FROM docs WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                self._delete_row(row[0])
+
+    def index_plan(self, plan: dict, plan_key: str) -> Tuple[int, int]:
+        """
+        Bring the documents of one plan up to date.
+
+        Only this plan's fingerprints are read; documents whose content
+        changed are re-indexed and documents no longer in the plan are
+        dropped, in one transaction. Returns (updated, removed) counts.
+        """
+        with self._conn:
+            known = {
+                key: (rowid, fingerprint)
+                for rowid, key, fingerprint in self._conn.execute(
+                    "SELECT rowid, key, fingerprint FROM docs WHERE plan = ?", (plan_key,)
+                )
+            }
+            seen = set()
+            updated = 0
+            for kind, doc_id, title, body in _iter_plan_documents(plan):
+                seen.add(f"{plan_key}:{doc_id}")
+                if self._upsert(plan_key, kind, doc_id, title, body, known):
+                    updated += 1
+
+            stale = [row[0] for key, row in known.items() if key not in seen]
+            for rowid in stale:
+                self._delete_row(rowid)
+        return updated, len(stale)
+
+    # -----------------------------
+    # Queries
+    # -----------------------------
+
+    def search(self, query: str, limit: int = 10) -> List[SearchHit]:
+        """
+        Rank documents against a query with BM25.
+
+        Terms are OR-ed together; "alert*" matches every term starting with
+        "alert".
+        """
+        expression = _match_expression(query)
+        if not expression:
+            return []
+        rows = self._conn.execute(
+            f"""
+            SELECT d.plan, d.kind, d.doc_id, d.title, -bm25(docs_fts, {_TITLE_WEIGHT}, 1.0) AS score
+            FROM docs_fts JOIN docs d ON d.rowid = docs_fts.rowid
+            WHERE docs_fts MATCH ?
+            ORDER BY score DESC
+            LIMIT ?
+            """,
+            (expression, limit),
+        )
+        return [SearchHit(*row) for row in rows]
@@ -1,9 +1,20 @@
 from __future__ import annotations
 
+import datetime as dt
 import json
 from pathlib import Path
 
-from app.core.planning.models import Plan
+from app.core.planning.models import (
+    Plan,
+    Epic,
+    Story,
+    Task,
+    Sprint,
+    TimeHorizon,
+    Priority,
+    Status,
+)
+from app.core.planning.search import INDEX_FILENAME, SearchIndex
 
 DATA_DIR = Path("data")
 DATA_DIR.mkdir(exist_ok=True)
@@ -12,8 +23,103 @@ DATA_DIR.mkdir(exist_ok=True)
 def save_plan(plan: Plan, filename: str = "plan.json") -> Path:
     """
     Serialize a Plan to JSON and save it under data/plan.json by default.
+
+    The workspace search index is refreshed for this plan at the same time.
     """
     path = DATA_DIR / filename
+    plan_dict = plan.to_dict()
     with path.open("w", encoding="utf-8") as f:
-        json.dump(plan.to_dict(), f, indent=2, default=str)
+        json.dump(plan_dict, f, indent=2, default=str)
+
+    update_search_index(plan_dict, filename)
     return path
+
+
+def update_search_index(plan_dict: dict, filename: str = "plan.json") -> Path:
+    """
+    Incrementally re-index one saved plan in data/search_index.db.
+    """
+    index_path = DATA_DIR / INDEX_FILENAME
+    with SearchIndex(index_path) as index:
+        index.index_plan(plan_dict, filename)
+    return index_path
+
+
+def _parse_date(value):
+    return dt.date.fromisoformat(value) if value else None
+
+
+def plan_from_dict(data: dict) -> Plan:
+    """
+    Rebuild Plan models from the dictionary written by save_plan.
+    """
+    epics = []
+    for e in data.get("epics", []):
+        stories = []
+        for s in e.get("stories", []):
+            tasks = [
+                Task(
+                    id=t["id"],
+                    story_id=t.get("story_id", s["id"]),
+                    title=t.get("title", ""),
+                    description=t.get("description", ""),
+                    estimate=t.get("estimate", "M"),
+                    status=Status(t.get("status", Status.PLANNED)),
+                    labels=list(t.get("labels", [])),
+                )
+                for t in s.get("tasks", [])
+            ]
+            stories.append(
+                Story(
+                    id=s["id"],
+                    epic_id=s.get("epic_id", e["id"]),
+                    title=s.get("title", ""),
+                    description=s.get("description", ""),
+                    acceptance_criteria=list(s.get("acceptance_criteria", [])),
+                    priority=Priority(s.get("priority", Priority.MEDIUM)),
+                    status=Status(s.get("status", Status.PLANNED)),
+                    tasks=tasks,
+                )
+            )
+        epics.append(
+            Epic(
+                id=e["id"],
+                title=e.get("title", ""),
+                description=e.get("description", ""),
+                priority=Priority(e.get("priority", Priority.HIGH)),
+                status=Status(e.get("status", Status.PLANNED)),
+                stories=stories,
+            )
+        )
+
+    sprints = [
+        Sprint(
+            id=sp["id"],
+            name=sp.get("name", ""),
+            start_date=_parse_date(sp.get("start_date")),
+            end_date=_parse_date(sp.get("end_date")),
+            goal=sp.get("goal", ""),
+            task_ids=list(sp.get("task_ids", [])),
+        )
+        for sp in data.get("sprints", [])
+    ]
+
+    created_at = data.get("created_at")
+    return Plan(
+        id=data["id"],
+        name=data.get("name", ""),
+        vision_text=data.get("vision_text", ""),
+        time_horizon=TimeHorizon(data.get("time_horizon", TimeHorizon.QUARTER)),
+        created_at=dt.datetime.fromisoformat(created_at) if created_at else dt.datetime.utcnow(),
+        epics=epics,
+        sprints=sprints,
+    )
+
+
+def load_plan(filename: str = "plan.json") -> Plan:
+    """
+    Load a Plan saved by save_plan, from data/plan.json by default.
+    """
+    path = DATA_DIR / filename
+    with path.open("r", encoding="utf-8") as f:
+        return plan_from_dict(json.load(f))
@@ -0,0 +1,346 @@
+# app/core/planning/snapshots.py
+
+from __future__ import annotations
+
+import datetime as dt
+import threading
+from dataclasses import asdict, dataclass, replace
+from typing import Dict, Optional, Tuple
+
+from app.core.planning.models import (
+    Plan,
+    Epic,
+    Story,
+    Task,
+    Sprint,
+    TimeHorizon,
+    Priority,
+    Status,
+)
+
+# -------------------------------------------------------------------
+# Copy-on-write plan snapshots
+#
+# Frozen mirrors of the models in models.py, with tuples instead of
+# lists. A write builds a new PlanSnapshot by copying only the path from
+# the root to the changed node (plan -> epic -> story -> task); every
+# untouched epic, story and task is shared with the previous version.
+# Readers take PlanStore.snapshot() - a single attribute read - and get
+# a consistent version without locking.
+# -------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class TaskSnapshot:
+    id: str
+    story_id: str
+    title: str
+    description: str = ""
+    estimate: str = "M"
+    status: Status = Status.PLANNED
+    labels: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class StorySnapshot:
+    id: str
+    epic_id: str
+    title: str
+    description: str = ""
+    acceptance_criteria: Tuple[str, ...] = ()
+    priority: Priority = Priority.MEDIUM
+    status: Status = Status.PLANNED
+    tasks: Tuple[TaskSnapshot, ...] = ()
+
+
+@dataclass(frozen=True)
+class EpicSnapshot:
+    id: str
+    title: str
+    description: str = ""
+    priority: Priority = Priority.HIGH
+    status: Status = Status.PLANNED
+    stories: Tuple[StorySnapshot, ...] = ()
+
+
+@dataclass(frozen=True)
+class SprintSnapshot:
+    id: str
+    name: str
+    start_date: Optional[dt.date] = None
+    end_date: Optional[dt.date] = None
+    goal: str = ""
+    task_ids: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class PlanSnapshot:
+    id: str
+    name: str
+    vision_text: str
+    time_horizon: TimeHorizon
+    created_at: dt.datetime
+    version: int = 0
+    epics: Tuple[EpicSnapshot, ...] = ()
+    sprints: Tuple[SprintSnapshot, ...] = ()
+
+    def to_plan(self) -> Plan:
+        """Thaw into a mutable Plan (a full copy, e.g. for save_plan)."""
+        return Plan(
+            id=self.id,
+            name=self.name,
+            vision_text=self.vision_text,
+            time_horizon=self.time_horizon,
+            created_at=self.created_at,
+            epics=[
+                Epic(
+                    id=e.id,
+                    title=e.title,
+                    description=e.description,
+                    priority=e.priority,
+                    status=e.status,
+                    stories=[
+                        Story(
+                            id=s.id,
+                            epic_id=s.epic_id,
+                            title=s.title,
+                            description=s.description,
+                            acceptance_criteria=list(s.acceptance_criteria),
+                            priority=s.priority,
+                            status=s.status,
+                            tasks=[
+                                Task(
+                                    id=t.id,
+                                    story_id=t.story_id,
+                                    title=t.title,
+                                    description=t.description,
+                                    estimate=t.estimate,
+                                    status=t.status,
+                                    labels=list(t.labels),
+                                )
+                                for t in s.tasks
+                            ],
+                        )
+                        for s in e.stories
+                    ],
+                )
+                for e in self.epics
+            ],
+            sprints=[
+                Sprint(
+                    id=sp.id,
+                    name=sp.name,
+                    start_date=sp.start_date,
+                    end_date=sp.end_date,
+                    goal=sp.goal,
+                    task_ids=list(sp.task_ids),
+                )
+                for sp in self.sprints
+            ],
+        )
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def _freeze_task(task: Task) -> TaskSnapshot:
+    return TaskSnapshot(
+        id=task.id,
+        story_id=task.story_id,
+        title=task.title,
+        description=task.description,
+        estimate=task.estimate,
+        status=task.status,
+        labels=tuple(task.labels),
+    )
+
+
+def snapshot_from_plan(plan: Plan, version: int = 0) -> PlanSnapshot:
+    """Freeze a mutable Plan into an immutable snapshot."""
+    return PlanSnapshot(
+        id=plan.id,
+        name=plan.name,
+        vision_text=plan.vision_text,
+        time_horizon=plan.time_horizon,
+        created_at=plan.created_at,
+        version=version,
+        epics=tuple(
+            EpicSnapshot(
+                id=e.id,
+                title=e.title,
+                description=e.description,
+                priority=e.priority,
+                status=e.status,
+                stories=tuple(
+                    StorySnapshot(
+                        id=s.id,
+                        epic_id=s.epic_id,
+                        title=s.title,
+                        description=s.description,
+                        acceptance_criteria=tuple(s.acceptance_criteria),
+                        priority=s.priority,
+                        status=s.status,
+                        tasks=tuple(_freeze_task(t) for t in s.tasks),
+                    )
+                    for s in e.stories
+                ),
+            )
+            for e in plan.epics
+        ),
+        sprints=tuple(
+            SprintSnapshot(
+                id=sp.id,
+                name=sp.name,
+                start_date=sp.start_date,
+                end_date=sp.end_date,
+                goal=sp.goal,
+                task_ids=tuple(sp.task_ids),
+            )
+            for sp in plan.sprints
+        ),
+    )
+
+
+def _replace_at(items: tuple, index: int, item) -> tuple:
+    """New tuple with one element swapped; the other elements are shared."""
+    return items[:index] + (item,) + items[index + 1:]
+
+
+# Update kwargs given as plain strings (e.g. status="done") are coerced,
+# so snapshots always hold the same enum members as the models
+_ENUM_FIELDS = {"status": Status, "priority": Priority, "time_horizon": TimeHorizon}
+
+
+def _freeze_changes(changes: dict) -> dict:
+    """Coerce enum fields and turn lists into tuples so snapshots stay immutable."""
+    frozen = {}
+    for key, value in changes.items():
+        if key in _ENUM_FIELDS:
+            value = _ENUM_FIELDS[key](value)
+        elif isinstance(value, list):
+            value = tuple(value)
+        frozen[key] = value
+    return frozen
+
+
+class PlanStore:
+    """
+    Holds the current PlanSnapshot. Reads are lock-free; writes are
+    serialized and publish a new version with path copying.
+    """
+
+    # Identity and structure change only through dedicated methods, so the
+    # writer-side id -> path index stays valid
+    _LOCKED_FIELDS = {"id", "epic_id", "story_id", "stories", "tasks"}
+
+    def __init__(self, plan: Plan) -> None:
+        self._current = snapshot_from_plan(plan)
+        self._write_lock = threading.Lock()
+        # id -> index path into the current snapshot; only writers touch it
+        self._epic_index: Dict[str, int] = {}
+        self._story_index: Dict[str, Tuple[int, int]] = {}
+        self._task_index: Dict[str, Tuple[int, int, int]] = {}
+        self._sprint_index: Dict[str, int] = {}
+        self._rebuild_index()
+
+    def snapshot(self) -> PlanSnapshot:
+        """The latest published version. O(1), never blocks."""
+        return self._current
+
+    # -----------------------------
+    # Writers
+    # -----------------------------
+
+    def update_task(self, task_id: str, **changes) -> PlanSnapshot:
+        self._check_fields(changes)
+        with self._write_lock:
+            e, s, t = self._locate(self._task_index, task_id)
+            plan = self._current
+            epic = plan.epics[e]
+            story = epic.stories[s]
+            task = replace(story.tasks[t], **_freeze_changes(changes))
+            story = replace(story, tasks=_replace_at(story.tasks, t, task))
+            epic = replace(epic, stories=_replace_at(epic.stories, s, story))
+            return self._publish(epics=_replace_at(plan.epics, e, epic))
+
+    def update_story(self, story_id: str, **changes) -> PlanSnapshot:
+        self._check_fields(changes)
+        with self._write_lock:
+            e, s = self._locate(self._story_index, story_id)
+            plan = self._current
+            epic = plan.epics[e]
+            story = replace(epic.stories[s], **_freeze_changes(changes))
+            epic = replace(epic, stories=_replace_at(epic.stories, s, story))
+            return self._publish(epics=_replace_at(plan.epics, e, epic))
+
+    def update_epic(self, epic_id: str, **changes) -> PlanSnapshot:
+        self._check_fields(changes)
+        with self._write_lock:
+            e = self._locate(self._epic_index, epic_id)
+            plan = self._current
+            epic = replace(plan.epics[e], **_freeze_changes(changes))
+            return self._publish(epics=_replace_at(plan.epics, e, epic))
+
+    def update_sprint(self, sprint_id: str, **changes) -> PlanSnapshot:
+        self._check_fields(changes)
+        with self._write_lock:
+            i = self._locate(self._sprint_index, sprint_id)
+            plan = self._current
+            sprint = replace(plan.sprints[i], **_freeze_changes(changes))
+            return self._publish(sprints=_replace_at(plan.sprints, i, sprint))
+
+    def add_task(self, task: Task) -> PlanSnapshot:
+        """Append a task to the story named by task.story_id."""
+        with self._write_lock:
+            e, s = self._locate(self._story_index, task.story_id)
+            if task.id in self._task_index:
+                raise ValueError(f"Task {task.id} already exists.")
+            plan = self._current
+            epic = plan.epics[e]
+            story = epic.stories[s]
+            story = replace(story, tasks=story.tasks + (_freeze_task(task),))
+            epic = replace(epic, stories=_replace_at(epic.stories, s, story))
+            self._task_index[task.id] = (e, s, len(story.tasks) - 1)
+            return self._publish(epics=_replace_at(plan.epics, e, epic))
+
+    def replace_plan(self, plan: Plan) -> PlanSnapshot:
+        """Swap in a whole new plan, e.g. after regeneration from a meeting."""
+        with self._write_lock:
+            self._current = snapshot_from_plan(plan, self._current.version + 1)
+            self._rebuild_index()
+            return self._current
+
+    # -----------------------------
+    # Internals
+    # -----------------------------
+
+    def _publish(self, **changes) -> PlanSnapshot:
+        """Build and publish the next version. Caller holds the write lock."""
+        self._current = replace(self._current, version=self._current.version + 1, **changes)
+        return self._current
+
+    def _check_fields(self, changes: dict) -> None:
+        locked = self._LOCKED_FIELDS & changes.keys()
+        if locked:
+            raise ValueError(f"Cannot update {', '.join(sorted(locked))} in place.")
+
+    @staticmethod
+    def _locate(index: dict, key: str):
+        try:
+            return index[key]
+        except KeyError:
+            raise KeyError(f"Unknown id: {key}") from None
+
+    def _rebuild_index(self) -> None:
+        self._epic_index.clear()
+        self._story_index.clear()
+        self._task_index.clear()
+        self._sprint_index.clear()
+        for e, epic in enumerate(self._current.epics):
+            self._epic_index[epic.id] = e
+            for s, story in enumerate(epic.stories):
+                self._story_index[story.id] = (e, s)
+                for t, task in enumerate(story.tasks):
+                    self._task_index[task.id] = (e, s, t)
+        for i, sprint in enumerate(self._current.sprints):
+            self._sprint_index[sprint.id] = i
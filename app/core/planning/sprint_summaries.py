@@ -0,0 +1,147 @@
+# app/core/planning/sprint_summaries.py
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from app.core.planning.models import ESTIMATE_POINTS, Epic, Sprint
+
+# -------------------------------------------------------------------
+# Sprint summaries (epics covered, points, label mix, goal text)
+#
+# Task -> (epic title, points, labels) lookups are built in one pass
+# over the plan, then each sprint only walks its own task ids. With a
+# SprintSummaryCache, a sprint whose position and tasks - including
+# their estimates, labels and epic titles - are unchanged since the
+# last allocation reuses its summary without any counting or text work.
+# -------------------------------------------------------------------
+
+MAX_EPICS_IN_GOAL = 3
+
+
+@dataclass
+class SprintSummary:
+    epic_titles: List[str] = field(default_factory=list)
+    points: int = 0
+    label_counts: Dict[str, int] = field(default_factory=dict)
+    goal: str = ""
+
+
+# (task id, epic title, points, labels) for one task of a sprint
+_TaskEntry = Tuple[str, str, int, Tuple[str, ...]]
+# (sprint position, project label, task entries) - every input of a summary
+_CacheKey = Tuple[int, str, Tuple[_TaskEntry, ...]]
+
+
+class SprintSummaryCache:
+    """
+    Per-sprint summaries keyed by everything a summary is built from.
+
+    The key holds each task's epic title, points and labels, so an entry
+    is not reused after a re-estimate, a label edit or an epic rename or
+    merge - no invalidation is needed when the plan changes.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, Tuple[_CacheKey, SprintSummary]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, sprint_id: str, key: _CacheKey) -> Optional[SprintSummary]:
+        entry = self._entries.get(sprint_id)
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        return None
+
+    def put(self, sprint_id: str, key: _CacheKey, summary: SprintSummary) -> None:
+        self._entries[sprint_id] = (key, summary)
+
+    def invalidate(self, sprint_id: Optional[str] = None) -> None:
+        """Drop one sprint's summary, or every summary when no id is given."""
+        if sprint_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(sprint_id, None)
+
+
+def project_label(vision_text: str) -> str:
+    """Short project label from the first line of the vision text."""
+    first_line = vision_text.strip().splitlines()[0] if vision_text.strip() else "this project"
+    if len(first_line) > 80:
+        first_line = first_line[:77] + "..."
+    return first_line
+
+
+def _goal_text(index: int, epic_titles: List[str], first_line: str) -> str:
+    if epic_titles:
+        # Only show at most three epic names
+        if len(epic_titles) > MAX_EPICS_IN_GOAL:
+            epic_list_str = ", ".join(epic_titles[:MAX_EPICS_IN_GOAL]) + ", and others"
+        else:
+            epic_list_str = ", ".join(epic_titles)
+    else:
+        epic_list_str = "key epics"
+
+    if index == 0:
+        return f"Foundations for '{first_line}'. Focus on {epic_list_str}."
+    if index == 1:
+        return f"Core implementation for {epic_list_str}."
+    if index == 2:
+        return f"Refinement and validation for {epic_list_str}."
+    return f"Ongoing improvements across {epic_list_str}."
+
+
+def _task_lookup(epics: List[Epic]) -> Dict[str, _TaskEntry]:
+    """task id -> (task id, epic title, points, labels), in one pass over the plan."""
+    lookup = {}
+    for epic in epics:
+        for story in epic.stories:
+            for task in story.tasks:
+                points = ESTIMATE_POINTS.get(task.estimate, ESTIMATE_POINTS["M"])
+                lookup[task.id] = (task.id, epic.title, points, tuple(task.labels))
+    return lookup
+
+
+def summarize_sprints(
+    sprints: List[Sprint],
+    epics: List[Epic],
+    vision_text: str,
+    cache: Optional[SprintSummaryCache] = None,
+) -> List[SprintSummary]:
+    """
+    Build a summary for every sprint, reusing cached ones whose inputs
+    have not changed.
+    """
+    first_line = project_label(vision_text)
+    lookup = _task_lookup(epics)
+    summaries: List[SprintSummary] = []
+
+    for index, sprint in enumerate(sprints):
+        entries = tuple(lookup[t] for t in sprint.task_ids if t in lookup)
+        key: _CacheKey = (index, first_line, entries)
+        summary = cache.get(sprint.id, key) if cache is not None else None
+        if summary is None:
+            epic_titles: Dict[str, None] = {}  # ordered set
+            labels: Counter = Counter()
+            points = 0
+            for _, epic_title, task_points, task_labels in entries:
+                epic_titles.setdefault(epic_title)
+                points += task_points
+                labels.update(task_labels)
+
+            titles = list(epic_titles)
+            summary = SprintSummary(
+                epic_titles=titles,
+                points=points,
+                label_counts=dict(labels),
+                goal=_goal_text(index, titles, first_line),
+            )
+            if cache is not None:
+                cache.put(sprint.id, key, summary)
+        summaries.append(summary)
+
+    return summaries
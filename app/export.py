@@ -0,0 +1,37 @@
+# app/export.py
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+from typing import List, Optional
+
+from app.core.planning.exporters import EXPORTERS
+from app.core.planning.serializers import DATA_DIR, load_plan
+
+DEFAULT_OUTPUTS = {
+    "csv": "tasks.csv",
+    "markdown": "roadmap.md",
+    "jsonl": "issues.jsonl",
+}
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Export the saved project plan.")
+    parser.add_argument("format", choices=sorted(EXPORTERS), help="Export format.")
+    parser.add_argument("--plan", default="plan.json", help="Plan file under data/.")
+    parser.add_argument("--out", help="Output path (defaults to a file under data/).")
+    args = parser.parse_args(argv)
+
+    if not (DATA_DIR / args.plan).exists():
+        print("❌ No plan found. Run `python -m app.main` first to create one.")
+        return
+
+    plan = load_plan(args.plan)
+    out = Path(args.out) if args.out else DATA_DIR / DEFAULT_OUTPUTS[args.format]
+    path = EXPORTERS[args.format](plan, out)
+    print(f"Exported {args.format} to: {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,107 @@
 
 from __future__ import annotations
 
+import argparse
 import json
+import time
 from pathlib import Path
+from typing import List, Optional
 
+from app.core.planning.forecasting import forecast_plan
+from app.core.planning.search import INDEX_FILENAME, SearchIndex
+from app.core.planning.serializers import load_plan
+
+
+def _open_index(data_dir: Path) -> SearchIndex:
+    """Open the workspace index, building it from saved plans on first use."""
+    index_path = data_dir / INDEX_FILENAME
+    is_new = not index_path.exists()
+    index = SearchIndex(index_path)
+    if is_new:
+        for plan_path in sorted(data_dir.glob("*.json")):
+            with plan_path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict) and "epics" in data:
+                index.index_plan(data, plan_path.name)
+    return index
+
+
+def search(query: str, limit: int = 10, data_dir: Path = Path("data")) -> None:
+    started = time.perf_counter()
+    with _open_index(data_dir) as index:
+        opened = time.perf_counter()
+        hits = index.search(query, limit=limit)
+        finished = time.perf_counter()
+        total = len(index)
+
+    print(f"\n=== SEARCH: {query} ===")
+    if not hits:
+        print("No matches.")
+    for rank, hit in enumerate(hits, start=1):
+        print(f"  {rank:>2}. [{hit.kind}] {hit.id} ({hit.plan})  score={hit.score:.2f}")
+        print(f"      {hit.title}")
+    print(
+        f"\n{total} documents indexed. "
+        f"Open {1000 * (opened - started):.1f} ms, query {1000 * (finished - opened):.1f} ms."
+    )
+
+
+def forecast(velocity: Optional[str] = None, filename: str = "plan.json") -> None:
+    plan = load_plan(filename)
+    history = [float(v) for v in velocity.split(",")] if velocity else None
+
+    started = time.perf_counter()
+    result = forecast_plan(plan, velocity_history=history)
+    elapsed = time.perf_counter() - started
+
+    titles = {epic.id: epic.title for epic in plan.epics}
+    header = "  ".join(f"P{p:<10}" for p in result.percentiles)
+
+    print("\n=== DELIVERY FORECAST ===")
+    print(f"Remaining points: {result.remaining_points:.0f}")
+    print(f"Velocity source:  {'history ' + velocity if velocity else 'planned sprint load'}")
+    print(f"\n  {'':<40}  {header}")
+    for epic_id, dates in result.epics.items():
+        row = "  ".join(f"{str(d):<11}" for d in dates.values())
+        print(f"  {titles[epic_id][:40]:<40}  {row}")
+    row = "  ".join(f"{str(d):<11}" for d in result.plan.values())
+    print(f"  {'Whole plan':<40}  {row}")
+    print(f"\n{result.simulations} simulations in {1000 * elapsed:.0f} ms.")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Inspect the saved project plan.")
+    parser.add_argument(
+        "--search",
+        metavar="QUERY",
+        help='Search epics, stories and tasks across saved plans. Use "term*" for prefix matches.',
+    )
+    parser.add_argument("--limit", type=int, default=10, help="Maximum number of search results.")
+    parser.add_argument(
+        "--forecast",
+        action="store_true",
+        help="Monte Carlo completion-date percentiles per epic and for the plan.",
+    )
+    parser.add_argument(
+        "--velocity",
+        metavar="POINTS",
+        help="Comma separated points completed in past sprints, e.g. 18,22,25.",
+    )
+    args = parser.parse_args(argv)
+
+    if args.search:
+        search(args.search, limit=args.limit)
+        return
 
-def main() -> None:
     data_path = Path("data/plan.json")
 
+    if args.forecast:
+        if not data_path.exists():
+            print("❌ No plan found. Run `python -m app.main` first to create one.")
+            return
+        forecast(args.velocity)
+        return
+
     if not data_path.exists():
         print("❌ No plan found. Run `python -m app.main` first to create one.")
         return
@@ -0,0 +1,116 @@
+# app/standup.py
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+from typing import List, Optional
+
+from app.core.planning.models import Status
+from app.core.planning.rollups import PlanRollups, carried_burndown
+from app.core.planning.serializers import DATA_DIR, load_plan, save_plan
+
+PLAN_FILENAME = "plan.json"
+ROLLUPS_FILENAME = "plan.rollups.json"
+
+
+# -----------------------------
+# Persisted rollups
+#
+# data/plan.rollups.json holds the rollups of data/plan.json together
+# with the plan file's (mtime, size) stamp. A report-only run reads just
+# that file; the plan is loaded and walked again only when the file is
+# missing or the plan was saved by something else since.
+# -----------------------------
+
+
+def _plan_stamp(plan_path: Path) -> List[int]:
+    stat = plan_path.stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _read_rollups_file(path: Path) -> dict:
+    if not path.exists():
+        return {}
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _load_rollups(plan_path: Path, rollups_path: Path) -> Optional[PlanRollups]:
+    """Persisted rollups if they still describe the saved plan, else None."""
+    data = _read_rollups_file(rollups_path)
+    if not data or data.get("plan_stamp") != _plan_stamp(plan_path):
+        return None
+    try:
+        return PlanRollups.from_dict(data["rollups"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _rebuild_rollups(plan_path: Path, rollups_path: Path) -> PlanRollups:
+    """Walk the saved plan again, keeping burndown samples that still apply to it."""
+    plan = load_plan(plan_path.name)
+    previous = _read_rollups_file(rollups_path).get("rollups", {})
+    return PlanRollups(plan, carried_burndown(previous, plan))
+
+
+def _save_rollups(rollups: PlanRollups, plan_path: Path, rollups_path: Path) -> None:
+    with rollups_path.open("w", encoding="utf-8") as f:
+        json.dump({"plan_stamp": _plan_stamp(plan_path), "rollups": rollups.to_dict()}, f)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Standup and progress report for the saved plan.")
+    parser.add_argument("--start", nargs="+", default=[], metavar="TASK_ID", help="Mark tasks in progress.")
+    parser.add_argument("--done", nargs="+", default=[], metavar="TASK_ID", help="Mark tasks done.")
+    parser.add_argument("--reset", nargs="+", default=[], metavar="TASK_ID", help="Mark tasks planned again.")
+    parser.add_argument(
+        "--estimate", nargs="+", default=[], metavar="TASK_ID=SIZE", help="Re-estimate tasks, e.g. TASK-3=L."
+    )
+    args = parser.parse_args(argv)
+
+    plan_path = DATA_DIR / PLAN_FILENAME
+    rollups_path = DATA_DIR / ROLLUPS_FILENAME
+    if not plan_path.exists():
+        print("❌ No plan found. Run `python -m app.main` first to create one.")
+        return
+
+    rollups = _load_rollups(plan_path, rollups_path)
+    if rollups is None:
+        rollups = _rebuild_rollups(plan_path, rollups_path)
+        _save_rollups(rollups, plan_path, rollups_path)
+
+    changes = (
+        [(t, Status.IN_PROGRESS) for t in args.start]
+        + [(t, Status.DONE) for t in args.done]
+        + [(t, Status.PLANNED) for t in args.reset]
+    )
+    if changes or args.estimate:
+        if rollups.plan is None:
+            rollups.attach(load_plan(PLAN_FILENAME))
+        # Apply nothing unless every change is valid; the plan on disk is untouched
+        try:
+            for task_id, status in changes:
+                rollups.set_task_status(task_id, status)
+            for item in args.estimate:
+                task_id, _, size = item.partition("=")
+                rollups.set_task_estimate(task_id, size.strip().upper())
+        except KeyError as e:
+            print(f"❌ {e.args[0]}")
+            return
+        except ValueError as e:
+            print(f"❌ {e}")
+            return
+
+        save_plan(rollups.plan, PLAN_FILENAME)
+        _save_rollups(rollups, plan_path, rollups_path)
+
+    print(rollups.standup_report())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+import time
+
+from app.core.planning.dedup import dedupe_epics, dedupe_plan, find_near_duplicates
+from app.core.planning.models import Epic, Plan, Sprint, Status, Story, Task, TimeHorizon
+
+
+DISTINCT_PAIRS = [
+    ("Implement user login", "Implement user logout"),
+    (
+        "As a user, I want to create a project so that I can organize my work",
+        "As a user, I want to delete a project so that I can organize my work",
+    ),
+    (
+        "As an analyst, I want to export reports as CSV",
+        "As an analyst, I want to export reports as PDF",
+    ),
+    ("Send alerts by email", "Send alerts by SMS"),
+]
+
+DUPLICATE_PAIRS = [
+    (
+        "As an admin I want email alerts when metrics breach thresholds",
+        "As an admin, I want e-mail alerts when metrics breach thresholds.",
+    ),
+    (
+        "As a user, I want to export reports as CSV",
+        "As a user I'd like to export the reports as CSV",
+    ),
+    ("Build the dashboard home page", "Build the dashboard home page."),
+]
+
+
+def _epic_with_stories(titles):
+    epic = Epic(id="EPIC-1", title="Epic")
+    epic.stories = [
+        Story(id=f"STORY-{i}", epic_id=epic.id, title=title)
+        for i, title in enumerate(titles, start=1)
+    ]
+    return epic
+
+
+def test_similar_but_distinct_stories_are_not_merged():
+    for a, b in DISTINCT_PAIRS:
+        assert find_near_duplicates([a, b]) == [], (a, b)
+
+
+def test_reworded_duplicates_are_merged():
+    for a, b in DUPLICATE_PAIRS:
+        assert find_near_duplicates([a, b]) == [[0, 1]], (a, b)
+
+
+def test_dedupe_epics_keeps_distinct_stories():
+    titles = [t for pair in DISTINCT_PAIRS for t in pair]
+    epics = dedupe_epics([_epic_with_stories(titles)])
+    assert [s.title for s in epics[0].stories] == titles
+
+
+def test_dedupe_epics_merges_into_first_occurrence():
+    a, b = DUPLICATE_PAIRS[0]
+    epic = _epic_with_stories([a, "Org health overview", b])
+    epic.stories[2].acceptance_criteria = ["Alert fires within a minute"]
+
+    epics = dedupe_epics([epic])
+
+    assert [s.id for s in epics[0].stories] == ["STORY-1", "STORY-2"]
+    assert epics[0].stories[0].acceptance_criteria == ["Alert fires within a minute"]
+
+
+def test_duplicates_found_regardless_of_unrelated_neighbours():
+    a, b = DUPLICATE_PAIRS[2]
+    texts = ["Configure the dashboard home page colours", a, "Unrelated billing work", b]
+    assert find_near_duplicates(texts) == [[1, 3]]
+
+
+def test_templated_distinct_stories_stay_fast():
+    texts = [f"As a user I want to manage project settings for team {n}" for n in range(5_000)]
+    texts.append("As a user, I want to manage project settings for team 17.")
+
+    started = time.perf_counter()
+    groups = find_near_duplicates(texts)
+    elapsed = time.perf_counter() - started
+
+    assert groups == [[17, 5_000]]
+    assert elapsed < 5.0, elapsed
+
+
+def _generated_tasks(story, first_id):
+    roles = [("Setup for", "setup", "S"), ("Implement", "implementation", "M"), ("Validate", "testing", "S")]
+    return [
+        Task(id=f"TASK-{first_id + k}", story_id=story.id, title=f"{prefix}: {story.title}", estimate=size, labels=[label])
+        for k, (prefix, label, size) in enumerate(roles)
+    ]
+
+
+def test_dedupe_plan_drops_duplicate_story_tasks_and_prunes_sprints():
+    a, b = DUPLICATE_PAIRS[1]
+    epic = _epic_with_stories([a, "Org health overview", b])
+    for k, story in enumerate(epic.stories):
+        story.tasks = _generated_tasks(story, 1 + 3 * k)
+    epic.stories[2].tasks[0].status = Status.DONE
+    plan = Plan(
+        id="PLAN-1",
+        name="Test",
+        vision_text="test",
+        time_horizon=TimeHorizon.QUARTER,
+        epics=[epic],
+        sprints=[
+            Sprint(id="SPRINT-1", name="Sprint 1", task_ids=["TASK-1", "TASK-2", "TASK-3", "TASK-4", "TASK-7"]),
+            Sprint(id="SPRINT-2", name="Sprint 2", task_ids=["TASK-5", "TASK-6", "TASK-8", "TASK-9"]),
+        ],
+    )
+
+    dedupe_plan(plan)
+
+    kept = plan.epics[0].stories[0]
+    assert [s.id for s in plan.epics[0].stories] == ["STORY-1", "STORY-2"]
+    assert [t.id for t in kept.tasks] == ["TASK-1", "TASK-2", "TASK-3"]
+    assert kept.tasks[0].status == Status.DONE
+    assert plan.sprints[0].task_ids == ["TASK-1", "TASK-2", "TASK-3", "TASK-4"]
+    assert plan.sprints[1].task_ids == ["TASK-5", "TASK-6"]
@@ -0,0 +1,145 @@
+import csv
+import json
+import random
+import re
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+from app.core.planning.exporters import (
+    CSV_COLUMNS,
+    export_issues_jsonl,
+    export_markdown_roadmap,
+    export_tasks_csv,
+)
+from app.core.planning.models import Epic, Plan, Sprint, Status, Story, Task, TimeHorizon
+
+
+def _plan(n_epics=12):
+    epics, task_ids = [], []
+    for e in range(1, n_epics + 1):
+        epic = Epic(id=f"EPIC-{e}", title=f"Epic {e}", description=f"About epic {e}")
+        for s in range(1, 3):
+            story = Story(
+                id=f"STORY-{e}-{s}",
+                epic_id=epic.id,
+                title=f"Story {e}.{s}",
+                acceptance_criteria=["Works"],
+            )
+            story.tasks = [
+                Task(id=f"TASK-{e}-{s}-{t}", story_id=story.id, title=f"Task {e}.{s}.{t}", labels=["setup", "api"])
+                for t in range(1, 3)
+            ]
+            task_ids += [t.id for t in story.tasks]
+            epic.stories.append(story)
+        epics.append(epic)
+    epics[0].stories[0].tasks[0].status = Status.DONE
+    # The last task stays unscheduled
+    sprints = [
+        Sprint(id=f"SPRINT-{i + 1}", name=f"Sprint {i + 1}", task_ids=task_ids[i * 5:(i + 1) * 5])
+        for i in range((len(task_ids) - 1) // 5 + 1)
+    ]
+    sprints[-1].task_ids = [t for t in sprints[-1].task_ids if t != task_ids[-1]]
+    return Plan(
+        id="PLAN-1",
+        name="Export test",
+        vision_text="Ship it",
+        time_horizon=TimeHorizon.QUARTER,
+        epics=epics,
+        sprints=sprints,
+    )
+
+
+def test_csv_has_one_row_per_task_with_sprint_columns(tmp_path):
+    plan = _plan(2)
+    path = export_tasks_csv(plan, tmp_path / "tasks.csv", chunk_size=3)
+
+    with path.open(encoding="utf-8", newline="") as f:
+        rows = list(csv.reader(f))
+
+    assert rows[0] == CSV_COLUMNS
+    records = [dict(zip(CSV_COLUMNS, row)) for row in rows[1:]]
+    assert [r["task_id"] for r in records] == [
+        t.id for e in plan.epics for s in e.stories for t in s.tasks
+    ]
+    first = records[0]
+    assert first["status"] == "done"
+    assert first["labels"] == "setup;api"
+    assert (first["story_id"], first["epic_id"], first["epic_title"]) == ("STORY-1-1", "EPIC-1", "Epic 1")
+    assert (first["sprint_id"], first["sprint_name"]) == ("SPRINT-1", "Sprint 1")
+    assert records[-1]["sprint_id"] == "" and records[-1]["sprint_start"] == ""
+
+
+def test_jsonl_lists_parents_before_children(tmp_path):
+    plan = _plan(3)
+    path = export_issues_jsonl(plan, tmp_path / "issues.jsonl", chunk_size=4)
+
+    records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    seen = set()
+    for record in records:
+        assert record["parent"] is None or record["parent"] in seen, record
+        seen.add(record["external_id"])
+
+    types = {r["external_id"]: r["issue_type"] for r in records}
+    assert len(records) == 3 + 6 + 12
+    assert types["EPIC-1"] == "Epic" and types["STORY-1-1"] == "Story" and types["TASK-1-1-1"] == "Sub-task"
+    assert "Acceptance criteria:\n- Works" in records[1]["description"]
+
+
+class _WindowedExecutor(Executor):
+    """Thread pool that finishes tasks out of order and tracks unconsumed futures."""
+
+    def __init__(self):
+        self._inner = ThreadPoolExecutor(max_workers=4)
+        self._lock = threading.Lock()
+        self.outstanding = 0
+        self.max_outstanding = 0
+
+    def submit(self, fn, *args, **kwargs):
+        def jittered():
+            time.sleep(random.uniform(0, 0.01))
+            return fn(*args, **kwargs)
+
+        future = self._inner.submit(jittered)
+        with self._lock:
+            self.outstanding += 1
+            self.max_outstanding = max(self.max_outstanding, self.outstanding)
+        result = future.result
+
+        def consume(timeout=None):
+            value = result(timeout)
+            with self._lock:
+                self.outstanding -= 1
+            return value
+
+        future.result = consume
+        return future
+
+    def shutdown(self, wait=True, **kwargs):
+        self._inner.shutdown(wait)
+
+
+def _epic_headings(path):
+    return re.findall(r"^## (Epic \d+)$", path.read_text(encoding="utf-8"), flags=re.M)
+
+
+def test_markdown_keeps_epic_order_within_the_window(tmp_path):
+    plan = _plan(12)
+    executor = _WindowedExecutor()
+    path = export_markdown_roadmap(plan, tmp_path / "roadmap.md", workers=2, executor=executor)
+    executor.shutdown()
+
+    assert _epic_headings(path) == [e.title for e in plan.epics]
+    assert executor.max_outstanding <= 4
+    text = path.read_text(encoding="utf-8")
+    assert "- [x] Task 1.1.1 (M, Sprint 1)" in text
+    assert "- [ ] Task 12.2.2 (M, unscheduled)" in text
+
+
+def test_markdown_with_a_process_pool(tmp_path):
+    plan = _plan(8)
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        path = export_markdown_roadmap(plan, tmp_path / "roadmap.md", workers=2, executor=pool)
+
+    assert _epic_headings(path) == [e.title for e in plan.epics]
+    assert "- [ ] Task 8.2.1 (M, Sprint 7)" in path.read_text(encoding="utf-8")
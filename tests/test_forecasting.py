@@ -0,0 +1,93 @@
+import datetime as dt
+import time
+
+import numpy as np
+
+from app.core.planning.forecasting import _column_percentiles, _finishing_sprints, forecast_plan
+from app.core.planning.models import Epic, Plan, Sprint, Story, Task, TimeHorizon
+
+
+TODAY = dt.date(2026, 1, 5)
+
+
+def _plan(n_epics=3, tasks_per_epic=6):
+    epics, task_ids = [], []
+    for e in range(n_epics):
+        tasks = [
+            Task(id=f"TASK-{e}-{t}", story_id=f"STORY-{e}", title="work", estimate="SML"[t % 3])
+            for t in range(tasks_per_epic)
+        ]
+        task_ids += [t.id for t in tasks]
+        story = Story(id=f"STORY-{e}", epic_id=f"EPIC-{e}", title="story", tasks=tasks)
+        epics.append(Epic(id=f"EPIC-{e}", title=f"Epic {e}", stories=[story]))
+    sprints = [
+        Sprint(id=f"SPRINT-{i}", name=f"Sprint {i}", task_ids=task_ids[i * 5:(i + 1) * 5])
+        for i in range((len(task_ids) + 4) // 5)
+    ]
+    return Plan(
+        id="PLAN-1",
+        name="Test",
+        vision_text="test",
+        time_horizon=TimeHorizon.QUARTER,
+        epics=epics,
+        sprints=sprints,
+    )
+
+
+def test_velocity_history_accepts_numpy_arrays():
+    plan = _plan()
+    from_list = forecast_plan(plan, [8, 10, 12], simulations=2_000, today=TODAY, seed=7)
+    from_array = forecast_plan(plan, np.array([8, 10, 12]), simulations=2_000, today=TODAY, seed=7)
+    assert from_array.plan == from_list.plan
+    assert from_array.epics == from_list.epics
+
+    empty = forecast_plan(plan, np.array([]), simulations=2_000, today=TODAY, seed=7)
+    prior = forecast_plan(plan, None, simulations=2_000, today=TODAY, seed=7)
+    assert empty.plan == prior.plan
+
+
+def test_percentiles_are_ordered_and_epics_finish_in_order():
+    forecast = forecast_plan(_plan(), [9, 11], simulations=5_000, today=TODAY, seed=1)
+    p50, p85, p95 = (forecast.plan[p] for p in (50, 85, 95))
+    assert TODAY <= p50 <= p85 <= p95
+    medians = [forecast.epics[f"EPIC-{e}"][50] for e in range(3)]
+    assert medians == sorted(medians)
+    assert medians[-1] == p50
+
+
+def _allocated_plan(n_epics, tasks_per_epic, n_sprints=6):
+    """Tasks allocated the way _allocate_sprints does: 5 per sprint, the rest in the last one."""
+    plan = _plan(n_epics, tasks_per_epic)
+    task_ids = [t.id for e in plan.epics for s in e.stories for t in s.tasks]
+    plan.sprints = [Sprint(id=f"SPRINT-{i}", name=f"Sprint {i}") for i in range(n_sprints)]
+    for i, task_id in enumerate(task_ids):
+        plan.sprints[min(i // 5, n_sprints - 1)].task_ids.append(task_id)
+    return plan
+
+
+def test_finishing_sprints_and_percentiles_match_reference():
+    rng = np.random.default_rng(3)
+    capacity = np.cumsum(rng.choice(np.float32([2, 3, 5]), size=(300, 40)), axis=1)
+    work = np.cumsum(rng.choice(np.float32([0, 1, 2.5, 3]), size=(300, 12)), axis=1)
+    work = np.minimum(work, capacity[:, -1:])  # includes exact ties and zero work
+
+    expected = np.array([np.searchsorted(c, w, side="left") for c, w in zip(capacity, work)])
+    finish = _finishing_sprints(capacity, work)
+    np.testing.assert_array_equal(finish, expected)
+
+    percentiles = (5, 50, 85, 95, 100)
+    np.testing.assert_array_equal(
+        _column_percentiles(finish, percentiles),
+        np.percentile(finish, percentiles, axis=0, method="higher"),
+    )
+
+
+def test_thousands_of_tasks_forecast_quickly():
+    plan = _allocated_plan(n_epics=150, tasks_per_epic=20)  # 3,000 tasks
+
+    for history in (None, [9, 11, 14]):
+        started = time.perf_counter()
+        forecast = forecast_plan(plan, history, today=TODAY, seed=5)
+        elapsed = time.perf_counter() - started
+        assert elapsed < 1.0, elapsed
+        assert len(forecast.epics) == 150
@@ -0,0 +1,219 @@
+import json
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.core.planning.llm_client import (
+    PATH_FALLBACK_MODEL,
+    PATH_HEDGED,
+    PATH_PRIMARY,
+    PATH_RETRY,
+    CallPolicy,
+    CircuitBreaker,
+    LLMClient,
+    LLMUnavailableError,
+    OllamaBackend,
+    _RequestCancelled,
+)
+
+MAIN = "main-model"
+SMALL = "small-model"
+
+
+def _client(hosts=("a", "b"), **policy):
+    defaults = dict(hedge_delay=0.05, backoff_base=0.001, backoff_max=0.001, reset_timeout=0.05)
+    defaults.update(policy)
+    return LLMClient(
+        [OllamaBackend(h) for h in hosts],
+        model=MAIN,
+        fallback_model=SMALL,
+        policy=CallPolicy(**defaults),
+    )
+
+
+def test_breaker_opens_then_admits_a_single_probe():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_primary_answer():
+    client = _client()
+    client._call_backend = lambda backend, prompt, model, timeout, cancel: f"{backend.url}:{model}"
+    assert client.generate("x") == (f"a:{MAIN}", PATH_PRIMARY)
+
+
+def test_slow_primary_is_hedged_and_then_cancelled():
+    client = _client()
+    cancelled = threading.Event()
+
+    def call(backend, prompt, model, timeout, cancel):
+        if backend.url == "a":
+            if cancel.wait(1):
+                cancelled.set()
+                raise _RequestCancelled(backend.url)
+            return "slow"
+        return "fast"
+
+    client._call_backend = call
+    assert client.generate("x") == ("fast", PATH_HEDGED)
+
+    assert cancelled.wait(1)
+    time.sleep(0.01)  # let the done-callback run
+    # A cancelled request is neither a success nor a failure
+    assert client.breakers[("a", MAIN)].state == CircuitBreaker.CLOSED
+    assert client.breakers[("a", MAIN)].failures == 0
+
+
+def test_unlaunched_spare_is_not_stuck_half_open():
+    client = _client(failure_threshold=1)
+    client._call_backend = lambda backend, prompt, model, timeout, cancel: "ok"
+    spare = client._breaker(OllamaBackend("b"), MAIN)
+    spare.record_failure()
+    time.sleep(0.06)
+
+    for _ in range(3):
+        assert client.generate("x") == ("ok", PATH_PRIMARY)
+
+    # The spare was never launched, so it still has its probe available
+    assert spare.state == CircuitBreaker.OPEN
+    assert spare.allow()
+
+
+def test_cancelled_probe_is_handed_back():
+    client = _client(failure_threshold=1)
+    probe_done = threading.Event()
+
+    def call(backend, prompt, model, timeout, cancel):
+        if backend.url == "a":
+            time.sleep(0.15)  # slower than the hedge delay, still wins
+            return "primary"
+        try:
+            if cancel.wait(1):
+                raise _RequestCancelled(backend.url)
+            return "probe"
+        finally:
+            probe_done.set()
+
+    client._call_backend = call
+    spare = client._breaker(OllamaBackend("b"), MAIN)
+    spare.record_failure()
+    time.sleep(0.06)
+
+    assert client.generate("x") == ("primary", PATH_PRIMARY)
+    assert probe_done.wait(1)
+    time.sleep(0.01)
+    # The probe had no outcome, so the next call may probe again
+    assert spare.state == CircuitBreaker.OPEN
+    assert spare.allow()
+
+
+class _StreamingOllama(BaseHTTPRequestHandler):
+    """Streams one token every 20 ms until the client goes away."""
+
+    disconnected = threading.Event()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.end_headers()
+        try:
+            for _ in range(500):
+                self.wfile.write(json.dumps({"response": "tok ", "done": False}).encode() + b"\n")
+                self.wfile.flush()
+                time.sleep(0.02)
+        except OSError:
+            type(self).disconnected.set()
+
+    def log_message(self, *args):
+        pass
+
+
+def test_cancel_closes_the_streaming_connection():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StreamingOllama)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        client = _client(hosts=(f"http://127.0.0.1:{server.server_port}",))
+        cancel = threading.Event()
+        threading.Timer(0.1, cancel.set).start()
+        with pytest.raises(_RequestCancelled):
+            client._call_backend(client.backends[0], "x", MAIN, 5.0, cancel)
+        assert _StreamingOllama.disconnected.wait(2)
+    finally:
+        server.shutdown()
+
+
+def test_losing_hedge_does_not_delay_exit():
+    script = """
+import time
+from app.core.planning.llm_client import CallPolicy, LLMClient, OllamaBackend
+
+def call(backend, prompt, model, timeout, cancel):
+    if backend.url == "a":
+        time.sleep(5)  # ignores cancel, like a stalled socket read
+    return backend.url
+
+client = LLMClient([OllamaBackend("a"), OllamaBackend("b")], policy=CallPolicy(hedge_delay=0.05))
+client._call_backend = call
+print(client.generate("x"))
+"""
+    started = time.monotonic()
+    subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, timeout=10)
+    assert time.monotonic() - started < 3
+
+
+def test_retry_after_transient_failure():
+    client = _client(hosts=("a",))
+    calls = []
+
+    def call(backend, prompt, model, timeout, cancel):
+        calls.append(model)
+        if len(calls) == 1:
+            raise IOError("blip")
+        return "ok"
+
+    client._call_backend = call
+    assert client.generate("x") == ("ok", PATH_RETRY)
+
+
+def test_falls_back_to_smaller_model():
+    client = _client()
+
+    def call(backend, prompt, model, timeout, cancel):
+        if model == MAIN:
+            raise IOError("out of memory")
+        return "small"
+
+    client._call_backend = call
+    assert client.generate("x") == ("small", PATH_FALLBACK_MODEL)
+    assert client.stats[PATH_FALLBACK_MODEL] == 1
+
+
+def test_deadline_bounds_the_whole_call():
+    client = _client(hosts=("a",), deadline=0.3, fallback_reserve=0.1, timeout=5.0)
+
+    def call(backend, prompt, model, timeout, cancel):
+        time.sleep(timeout)
+        raise IOError("timed out")
+
+    client._call_backend = call
+    started = time.monotonic()
+    with pytest.raises(LLMUnavailableError):
+        client.generate("x")
+    assert time.monotonic() - started < 0.6
@@ -0,0 +1,161 @@
+import datetime as dt
+import json
+
+import pytest
+
+from app.core.planning.models import Epic, Plan, Sprint, Status, Story, Task, TimeHorizon
+from app.core.planning.rollups import PlanRollups, carried_burndown
+
+START = dt.date(2026, 3, 2)
+
+
+def _plan():
+    epics, task_ids = [], []
+    for e in range(1, 3):
+        epic = Epic(id=f"EPIC-{e}", title=f"Epic {e}")
+        for s in range(1, 3):
+            story = Story(id=f"STORY-{e}-{s}", epic_id=epic.id, title=f"Story {e}.{s}")
+            story.tasks = [
+                Task(id=f"TASK-{e}-{s}-{t}", story_id=story.id, title="work", estimate=size)
+                for t, size in enumerate("SML", start=1)
+            ]
+            task_ids += [t.id for t in story.tasks]
+            epic.stories.append(story)
+        epics.append(epic)
+    sprints = [
+        Sprint(
+            id=f"SPRINT-{i + 1}",
+            name=f"Sprint {i + 1}",
+            start_date=START + dt.timedelta(days=14 * i),
+            end_date=START + dt.timedelta(days=14 * i + 13),
+            goal="Ship",
+            task_ids=task_ids[i * 5:(i + 1) * 5],
+        )
+        for i in range(2)
+    ]
+    # TASK-2-2-2 and TASK-2-2-3 stay unscheduled
+    return Plan(
+        id="PLAN-1",
+        name="Rollups",
+        vision_text="v",
+        time_horizon=TimeHorizon.MONTH,
+        created_at=dt.datetime(2026, 3, 1, 9, 0),
+        epics=epics,
+        sprints=sprints,
+    )
+
+
+def _state(rollups):
+    state = rollups.to_dict()
+    state.pop("burndown")
+    return state
+
+
+def test_story_and_epic_status_are_derived():
+    plan = _plan()
+    rollups = PlanRollups(plan)
+    epic = plan.epics[0]
+    story = epic.stories[0]
+
+    rollups.set_task_status("TASK-1-1-1", Status.IN_PROGRESS, START)
+    assert (story.status, epic.status) == (Status.IN_PROGRESS, Status.IN_PROGRESS)
+
+    for task in story.tasks:
+        rollups.set_task_status(task.id, Status.DONE, START)
+    assert story.status == Status.DONE
+    assert epic.status == Status.IN_PROGRESS
+
+    rollups.set_task_status("TASK-1-1-2", Status.PLANNED, START)
+    assert story.status == Status.IN_PROGRESS
+    assert plan.epics[1].status == Status.PLANNED
+
+
+def test_incremental_updates_match_a_fresh_rebuild():
+    plan = _plan()
+    rollups = PlanRollups(plan)
+    rollups.set_task_status("TASK-1-1-1", Status.DONE, START)
+    rollups.set_task_estimate("TASK-1-1-1", "L", START)
+    rollups.set_task_status("TASK-1-2-3", Status.IN_PROGRESS, START)
+    rollups.set_task_status("TASK-2-2-3", Status.DONE, START)  # unscheduled
+    rollups.set_task_estimate("TASK-2-1-1", "M", START)
+    rollups.set_task_status("TASK-1-2-3", Status.DONE, START)
+    rollups.set_task_status("TASK-1-1-1", Status.PLANNED, START)
+
+    assert _state(rollups) == _state(PlanRollups(plan))
+    assert rollups.plan_rollup.total_tasks == 12
+    assert rollups.sprints["SPRINT-2"].points[Status.DONE] == 5
+
+
+def test_round_trip_through_json():
+    plan = _plan()
+    rollups = PlanRollups(plan)
+    rollups.set_task_status("TASK-1-1-2", Status.DONE, START + dt.timedelta(days=1))
+
+    restored = PlanRollups.from_dict(json.loads(json.dumps(rollups.to_dict())))
+
+    assert restored.to_dict() == rollups.to_dict()
+    assert restored.standup_report(START + dt.timedelta(days=2)) == rollups.standup_report(
+        START + dt.timedelta(days=2)
+    )
+
+    restored.attach(plan)
+    restored.set_task_status("TASK-1-1-3", Status.DONE, START + dt.timedelta(days=2))
+    assert _state(restored) == _state(PlanRollups(plan))
+
+
+def test_burndown_carries_the_last_sample_forward():
+    plan = _plan()
+    rollups = PlanRollups(plan)
+    sprint = plan.sprints[0]
+    total = rollups.sprints[sprint.id].total_points
+
+    rollups.set_task_status("TASK-1-1-3", Status.DONE, START + dt.timedelta(days=1))
+    rows = rollups.sprint_burndown(sprint, START + dt.timedelta(days=4))
+
+    assert [row[0] for row in rows] == [START + dt.timedelta(days=d) for d in range(5)]
+    assert rows[0][1] == total
+    assert [row[2] for row in rows] == [None, total - 5, total - 5, total - 5, total - 5]
+
+
+def test_updates_refuse_a_plan_that_changed_shape():
+    plan = _plan()
+    rollups = PlanRollups(plan)
+
+    plan.epics[0].stories[0].tasks.reverse()
+    with pytest.raises(ValueError):
+        rollups.set_task_status("TASK-1-1-1", Status.DONE, START)
+
+    plan = _plan()
+    rollups = PlanRollups(plan)
+    plan.sprints[0].task_ids.remove("TASK-1-1-1")
+    with pytest.raises(ValueError):
+        rollups.set_task_status("TASK-1-1-1", Status.DONE, START)
+
+    with pytest.raises(KeyError):
+        rollups.set_task_status("TASK-999", Status.DONE, START)
+
+
+def test_attach_rejects_another_plan():
+    rollups = PlanRollups.from_dict(PlanRollups(_plan()).to_dict())
+    other = _plan()
+    other.created_at = dt.datetime(2026, 4, 1)
+    with pytest.raises(ValueError):
+        rollups.attach(other)
+
+
+def test_burndown_is_kept_only_for_the_same_plan_and_sprint_dates():
+    plan = _plan()
+    rollups = PlanRollups(plan)
+    rollups.set_task_status("TASK-1-1-1", Status.DONE, START)
+    rollups.set_task_status("TASK-1-2-3", Status.DONE, START + dt.timedelta(days=14))
+    previous = rollups.to_dict()
+
+    assert carried_burndown(previous, _plan()) == previous["burndown"]
+
+    moved = _plan()
+    moved.sprints[1].start_date += dt.timedelta(days=1)
+    assert set(carried_burndown(previous, moved)) == {"SPRINT-1"}
+
+    regenerated = _plan()
+    regenerated.created_at = dt.datetime(2026, 3, 20, 9, 0)
+    assert carried_burndown(previous, regenerated) == {}
@@ -0,0 +1,113 @@
+import copy
+
+import pytest
+
+from app.core.planning.search import SearchIndex
+
+
+def _plan_dict():
+    return {
+        "epics": [
+            {
+                "id": "EPIC-1",
+                "title": "Alerting",
+                "description": "Notify admins by email when metrics breach thresholds.",
+                "stories": [
+                    {
+                        "id": "STORY-1",
+                        "title": "Email alerts",
+                        "description": "Send an email when a threshold is breached.",
+                        "acceptance_criteria": ["Alert arrives within a minute"],
+                        "tasks": [
+                            {"id": "TASK-1", "title": "Setup for: Email alerts", "description": "SMTP config", "labels": ["setup"]},
+                            {"id": "TASK-2", "title": "Implement: Email alerts", "description": "", "labels": ["implementation"]},
+                        ],
+                    },
+                    {
+                        "id": "STORY-2",
+                        "title": "Dashboard widgets",
+                        "description": "Show an alert banner on the dashboard.",
+                        "acceptance_criteria": [],
+                        "tasks": [],
+                    },
+                ],
+            }
+        ]
+    }
+
+
+@pytest.fixture
+def index(tmp_path):
+    with SearchIndex(tmp_path / "search_index.db") as idx:
+        yield idx
+
+
+def _ids(hits):
+    return [hit.id for hit in hits]
+
+
+def test_unchanged_save_reindexes_nothing(index):
+    plan = _plan_dict()
+    assert index.index_plan(plan, "plan.json") == (5, 0)
+    assert index.index_plan(copy.deepcopy(plan), "plan.json") == (0, 0)
+
+    plan["epics"][0]["stories"][1]["title"] = "Dashboard alert widgets"
+    assert index.index_plan(plan, "plan.json") == (1, 0)
+    assert len(index) == 5
+
+
+def test_removed_documents_are_dropped(index):
+    plan = _plan_dict()
+    index.index_plan(plan, "plan.json")
+
+    plan["epics"][0]["stories"][0]["tasks"].pop()
+    del plan["epics"][0]["stories"][1]
+    assert index.index_plan(plan, "plan.json") == (0, 2)
+    assert len(index) == 3
+    assert index.search("dashboard") == []
+
+
+def test_prefix_queries(index):
+    index.index_plan(_plan_dict(), "plan.json")
+    assert index.search("alert") and "EPIC-1" not in _ids(index.search("alert"))
+    assert "EPIC-1" in _ids(index.search("alert*"))  # "Alerting"
+
+
+def test_title_matches_rank_above_body_only_matches(index):
+    index.index_plan(_plan_dict(), "plan.json")
+    hits = _ids(index.search("dashboard"))
+    assert hits[0] == "STORY-2"
+
+    # The epic mentions email only in its description
+    hits = _ids(index.search("email"))
+    assert set(hits[:3]) == {"STORY-1", "TASK-1", "TASK-2"}
+    assert hits[3] == "EPIC-1"
+
+
+@pytest.mark.parametrize(
+    "query",
+    ['email" OR "dashboard', "title:email", "email AND", "NEAR(email alerts)", "-email", "(email", "email^", '"'],
+)
+def test_fts5_syntax_in_queries_is_neutralized(index, query):
+    index.index_plan(_plan_dict(), "plan.json")
+    hits = index.search(query)  # must not raise sqlite3.OperationalError
+    assert all(hit.plan == "plan.json" for hit in hits)
+
+
+def test_plans_are_indexed_independently(index):
+    first = _plan_dict()
+    second = _plan_dict()
+    second["epics"][0]["title"] = "Billing"
+    second["epics"][0]["stories"] = []
+
+    index.index_plan(first, "plan.json")
+    assert index.index_plan(second, "other.json") == (1, 0)
+    assert len(index) == 6
+
+    # Re-indexing one plan leaves the other's documents alone
+    assert index.index_plan({"epics": []}, "other.json") == (0, 1)
+    assert len(index) == 5
+    assert {hit.plan for hit in index.search("alert*")} == {"plan.json"}
+
+    index.index_plan(second, "other.json")
+    assert [(hit.plan, hit.id) for hit in index.search("billing")] == [("other.json", "EPIC-1")]
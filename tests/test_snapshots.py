@@ -0,0 +1,120 @@
+import sys
+import threading
+
+import pytest
+
+from app.core.planning.models import Epic, Plan, Priority, Sprint, Status, Story, Task, TimeHorizon
+from app.core.planning.snapshots import PlanStore
+
+
+def _plan():
+    epics = []
+    for e in range(1, 3):
+        epic = Epic(id=f"EPIC-{e}", title=f"Epic {e}")
+        for s in range(1, 3):
+            story = Story(id=f"STORY-{e}-{s}", epic_id=epic.id, title=f"Story {e}.{s}")
+            story.tasks = [
+                Task(id=f"TASK-{e}-{s}-{t}", story_id=story.id, title=f"Task {e}.{s}.{t}", labels=["setup"])
+                for t in range(1, 5)
+            ]
+            epic.stories.append(story)
+        epics.append(epic)
+    sprints = [Sprint(id="SPRINT-1", name="Sprint 1", task_ids=["TASK-1-1-1"])]
+    return Plan(id="PLAN-1", name="Store", vision_text="v", time_horizon=TimeHorizon.QUARTER, epics=epics, sprints=sprints)
+
+
+def test_untouched_nodes_are_shared_between_versions():
+    store = PlanStore(_plan())
+    before = store.snapshot()
+    after = store.update_task("TASK-1-2-3", title="Renamed")
+
+    assert after.version == before.version + 1
+    assert after.epics[1] is before.epics[1]
+    assert after.epics[0] is not before.epics[0]
+    assert after.epics[0].stories[0] is before.epics[0].stories[0]
+    assert after.epics[0].stories[1] is not before.epics[0].stories[1]
+    changed = after.epics[0].stories[1].tasks
+    unchanged = before.epics[0].stories[1].tasks
+    assert [a is b for a, b in zip(changed, unchanged)] == [True, True, False, True]
+    assert after.sprints is before.sprints
+
+
+def test_older_snapshots_do_not_see_later_writes():
+    store = PlanStore(_plan())
+    first = store.snapshot()
+    store.update_task("TASK-1-1-1", status=Status.DONE, labels=["setup", "api"])
+    store.update_story("STORY-2-1", title="New story title")
+    store.update_epic("EPIC-2", priority=Priority.LOW)
+    store.update_sprint("SPRINT-1", goal="Ship")
+
+    task = first.epics[0].stories[0].tasks[0]
+    assert (task.status, task.labels) == (Status.PLANNED, ("setup",))
+    assert first.epics[1].stories[0].title == "Story 2.1"
+    assert first.epics[1].priority == Priority.HIGH
+    assert first.sprints[0].goal == ""
+
+    latest = store.snapshot()
+    assert latest.epics[0].stories[0].tasks[0].labels == ("setup", "api")
+    assert latest.version == first.version + 4
+
+
+def test_added_task_can_be_updated():
+    store = PlanStore(_plan())
+    store.add_task(Task(id="TASK-NEW", story_id="STORY-2-2", title="Added"))
+    snapshot = store.update_task("TASK-NEW", status="in_progress")
+
+    task = snapshot.epics[1].stories[1].tasks[-1]
+    assert (task.id, task.status) == ("TASK-NEW", Status.IN_PROGRESS)
+    with pytest.raises(ValueError):
+        store.add_task(Task(id="TASK-NEW", story_id="STORY-2-2", title="Again"))
+
+
+def test_enum_fields_are_coerced():
+    store = PlanStore(_plan())
+    snapshot = store.update_task("TASK-1-1-1", status="done")
+    assert snapshot.epics[0].stories[0].tasks[0].status is Status.DONE
+    snapshot = store.update_epic("EPIC-1", priority="low")
+    assert snapshot.epics[0].priority is Priority.LOW
+    with pytest.raises(ValueError):
+        store.update_task("TASK-1-1-1", status="finished")
+
+
+def test_locked_fields_and_unknown_ids_are_rejected():
+    store = PlanStore(_plan())
+    version = store.snapshot().version
+    for kwargs in ({"id": "X"}, {"story_id": "STORY-2-1"}, {"tasks": []}):
+        with pytest.raises(ValueError):
+            store.update_task("TASK-1-1-1", **kwargs)
+    with pytest.raises(ValueError):
+        store.update_story("STORY-1-1", epic_id="EPIC-2")
+    with pytest.raises(KeyError):
+        store.update_task("TASK-404", title="x")
+    assert store.snapshot().version == version
+
+
+def test_concurrent_writers_never_lose_an_update():
+    store = PlanStore(_plan())
+    task_ids = [t.id for e in store.snapshot().epics for s in e.stories for t in s.tasks]
+    rounds = 200
+    start = threading.Barrier(len(task_ids))
+
+    def writer(task_id):
+        start.wait()
+        for i in range(rounds):
+            store.update_task(task_id, title=f"{task_id} v{i}")
+
+    threads = [threading.Thread(target=writer, args=(t,)) for t in task_ids]
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # switch threads often enough to expose races
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    final = store.snapshot()
+    assert final.version == len(task_ids) * rounds
+    titles = {t.id: t.title for e in final.epics for s in e.stories for t in s.tasks}
+    assert titles == {t: f"{t} v{rounds - 1}" for t in task_ids}
@@ -0,0 +1,61 @@
+from app.core.planning.models import Epic, Sprint, Story, Task
+from app.core.planning.sprint_summaries import SprintSummaryCache, summarize_sprints
+
+
+VISION = "Internal dashboard for ops metrics"
+
+
+def _plan():
+    tasks = [
+        Task(id="TASK-1", story_id="STORY-1", title="Schema", estimate="S", labels=["backend"]),
+        Task(id="TASK-2", story_id="STORY-1", title="API", estimate="M", labels=["backend"]),
+        Task(id="TASK-3", story_id="STORY-2", title="Charts", estimate="L", labels=["frontend"]),
+    ]
+    epics = [
+        Epic(id="EPIC-1", title="Data", stories=[Story(id="STORY-1", epic_id="EPIC-1", title="Store", tasks=tasks[:2])]),
+        Epic(id="EPIC-2", title="UI", stories=[Story(id="STORY-2", epic_id="EPIC-2", title="View", tasks=tasks[2:])]),
+    ]
+    sprints = [
+        Sprint(id="SPRINT-1", name="Sprint 1", task_ids=["TASK-1", "TASK-2"]),
+        Sprint(id="SPRINT-2", name="Sprint 2", task_ids=["TASK-3"]),
+    ]
+    return epics, sprints, tasks
+
+
+def test_unchanged_sprints_hit_the_cache():
+    epics, sprints, _ = _plan()
+    cache = SprintSummaryCache()
+    first = summarize_sprints(sprints, epics, VISION, cache)
+    second = summarize_sprints(sprints, epics, VISION, cache)
+
+    assert cache.hits == 2
+    assert second == first
+    assert first[0].points == 4
+    assert first[0].label_counts == {"backend": 2}
+    assert first[1].epic_titles == ["UI"]
+
+
+def test_estimate_and_label_changes_refresh_the_summary():
+    epics, sprints, tasks = _plan()
+    cache = SprintSummaryCache()
+    summarize_sprints(sprints, epics, VISION, cache)
+
+    tasks[0].estimate = "L"
+    tasks[1].labels = ["backend", "security"]
+    summaries = summarize_sprints(sprints, epics, VISION, cache)
+
+    assert summaries[0].points == 8
+    assert summaries[0].label_counts == {"backend": 2, "security": 1}
+    assert cache.hits == 1  # only the untouched sprint
+
+
+def test_epic_title_changes_refresh_the_goal():
+    epics, sprints, _ = _plan()
+    cache = SprintSummaryCache()
+    summarize_sprints(sprints, epics, VISION, cache)
+
+    epics[1].title = "Dashboards"
+    summaries = summarize_sprints(sprints, epics, VISION, cache)
+
+    assert summaries[1].epic_titles == ["Dashboards"]
+    assert "Dashboards" in summaries[1].goal